@@ -81,6 +81,10 @@ class StructuredOutputExtractor(Generic[T]):
         self.schema = schema
         self.base_url = base_url
         
+        # Precompute numeric (ge, le) bounds once so validation can clamp
+        # without re-walking Pydantic field metadata per record
+        self._bounds = self._collect_bounds(schema) if schema else {}
+        
         # Task-specific LLMs with optimized temperatures (December 2025 best practice)
         self.reasoning_llm = ChatOllama(
             model=model_name,
@@ -103,6 +107,19 @@ class StructuredOutputExtractor(Generic[T]):
             num_predict=256,
         )
     
+    @staticmethod
+    def _collect_bounds(schema: Type[BaseModel]) -> Dict[str, tuple]:
+        """Map field name -> (ge, le) from Pydantic Field constraints."""
+        bounds = {}
+        for field_name, field_info in schema.model_fields.items():
+            ge = le = None
+            for constraint in field_info.metadata:
+                ge = getattr(constraint, 'ge', ge)
+                le = getattr(constraint, 'le', le)
+            if ge is not None or le is not None:
+                bounds[field_name] = (ge, le)
+        return bounds
+    
     def intelligence_agent(self, prompt: str) -> str:
         """
         Agent 1: Intelligence (Free-form Reasoning)
@@ -282,10 +299,12 @@ Return the corrected JSON object (no markdown, no explanation):
         # Extract common patterns
         for field_name, field_info in self.schema.model_fields.items():
             field_type = field_info.annotation
+            # Match "field_name" also as "field name" / "fieldname"
+            name_variant = field_name.replace("_", r"[_\s]*")
             
             # Try to extract based on field name and type
             if field_type == int or (hasattr(field_type, '__origin__') and field_type.__origin__ == int):
-                pattern = rf'(?:{field_name}|{field_name.replace("_", "[_\s]*")})[^:]*[:\s]*(\d+)'
+                pattern = rf'(?:{field_name}|{name_variant})[^:]*[:\s]*(\d+)'
                 match = re.search(pattern, analysis_text, re.IGNORECASE)
                 if match:
                     try:
@@ -294,7 +313,7 @@ Return the corrected JSON object (no markdown, no explanation):
                         pass
             
             elif field_type == float or (hasattr(field_type, '__origin__') and field_type.__origin__ == float):
-                pattern = rf'(?:{field_name}|{field_name.replace("_", "[_\s]*")})[^:]*[:\s]*(\d+\.?\d*)'
+                pattern = rf'(?:{field_name}|{name_variant})[^:]*[:\s]*(\d+\.?\d*)'
                 match = re.search(pattern, analysis_text, re.IGNORECASE)
                 if match:
                     try:
@@ -345,28 +364,26 @@ Return the corrected JSON object (no markdown, no explanation):
         # Check bounds from Pydantic Field constraints
         for field_name, field_info in self.schema.model_fields.items():
             if field_name not in data:
-                # Missing required field - try to fill from context
-                if field_info.default is not None:
-                    data[field_name] = field_info.default
+                # Missing field - use its default, else try to fill from context
+                if not field_info.is_required():
+                    data[field_name] = field_info.get_default(call_default_factory=True)
                 elif field_name in context:
                     data[field_name] = context[field_name]
                     warnings.append(f"Missing {field_name}, filled from context")
                 else:
                     warnings.append(f"Missing required field: {field_name}")
             
-            # Check Field constraints (ge, le, min_length, max_length)
-            if field_name in data:
+            # Check numeric bounds (precomputed ge/le constraints)
+            if field_name in data and field_name in self._bounds:
                 value = data[field_name]
-                
-                # Check numeric bounds
                 if isinstance(value, (int, float)):
-                    if hasattr(field_info, 'constraints'):
-                        if 'ge' in field_info.constraints and value < field_info.constraints['ge']:
-                            warnings.append(f"{field_name} < {field_info.constraints['ge']}, adjusting")
-                            data[field_name] = field_info.constraints['ge']
-                        if 'le' in field_info.constraints and value > field_info.constraints['le']:
-                            warnings.append(f"{field_name} > {field_info.constraints['le']}, capping")
-                            data[field_name] = field_info.constraints['le']
+                    ge, le = self._bounds[field_name]
+                    if ge is not None and value < ge:
+                        warnings.append(f"{field_name} < {ge}, adjusting")
+                        data[field_name] = ge
+                    if le is not None and value > le:
+                        warnings.append(f"{field_name} > {le}, capping")
+                        data[field_name] = le
         
         # Log warnings
         for warning in warnings:
@@ -377,26 +394,60 @@ Return the corrected JSON object (no markdown, no explanation):
             return self.schema(**data)
         except ValidationError as e:
             # Try to fix common validation errors
-            errors = e.errors()
-            for error in errors:
-                field_name = error.get('loc', ['unknown'])[0]
-                error_type = error.get('type')
-                
-                if error_type == 'missing':
-                    # Fill missing field from context or default
-                    if field_name in context:
-                        data[field_name] = context[field_name]
-                    elif self.schema.model_fields[field_name].default is not None:
-                        data[field_name] = self.schema.model_fields[field_name].default
-                    else:
-                        raise ValueError(f"Cannot fix missing required field: {field_name}")
-            
-            # Retry validation
             try:
-                return self.schema(**data)
+                return self._fast_fix_and_validate(data, e.errors(), context)
             except ValidationError:
                 raise ValueError(f"Validation failed after fixes: {e}")
     
+    _BOUND_ERRORS = frozenset({
+        'greater_than', 'greater_than_equal', 'less_than', 'less_than_equal'
+    })
+    
+    def _fast_fix_and_validate(
+        self,
+        data: Dict[str, Any],
+        errors: list,
+        context: Dict[str, Any]
+    ) -> T:
+        """
+        Repair a record from its ValidationError list and validate it again.
+        
+        Missing top-level fields are filled from context or from the field's
+        own default/default_factory, and numeric bound errors are clamped via
+        ``self._bounds``. Errors inside nested models are left for the final
+        validation to report.
+        
+        Raises:
+            ValueError: If a missing required field cannot be filled
+            ValidationError: If the repaired data is still invalid
+        """
+        for error in errors:
+            loc = error.get('loc') or ('unknown',)
+            field_name = loc[0]
+            error_type = error.get('type')
+            if len(loc) != 1 or field_name not in self.schema.model_fields:
+                continue
+            
+            if error_type == 'missing':
+                # Fill missing field from context or a real default
+                field_info = self.schema.model_fields[field_name]
+                if field_name in context:
+                    data[field_name] = context[field_name]
+                elif not field_info.is_required():
+                    data[field_name] = field_info.get_default(call_default_factory=True)
+                else:
+                    raise ValueError(f"Cannot fix missing required field: {field_name}")
+            elif error_type in self._BOUND_ERRORS and field_name in self._bounds:
+                ge, le = self._bounds[field_name]
+                value = data.get(field_name)
+                if isinstance(value, (int, float)):
+                    if ge is not None and value < ge:
+                        data[field_name] = ge
+                    elif le is not None and value > le:
+                        data[field_name] = le
+        
+        return self.schema.model_validate(data)
+    
     def extract(
         self,
         intelligence_prompt: str,
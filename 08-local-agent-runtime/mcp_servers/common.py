@@ -0,0 +1,67 @@
+"""
+Shared pieces of the MCP servers: the batch endpoint and the launcher.
+"""
+
+from fastapi import FastAPI, HTTPException
+from pydantic import BaseModel
+from pathlib import Path
+import asyncio
+import os
+
+
+class BatchRequest(BaseModel):
+    calls: list[dict]
+
+
+def add_batch_endpoint(app: FastAPI, dispatch: dict) -> None:
+    """
+    Register POST /mcp/tools/batch on app.
+
+    Args:
+        app: Server application
+        dispatch: Tool name -> (async handler, request model)
+    """
+    async def run_call(name: str, args: dict) -> dict:
+        """Run one tool call from a batch, reporting failures in-band."""
+        entry = dispatch.get(name)
+        if entry is None:
+            return {"content": f"Error: Unknown tool: {name}"}
+        handler, model = entry
+        try:
+            return await handler(model(**args))
+        except HTTPException as e:
+            return {"content": f"Error: {e.detail}"}
+        except Exception as e:
+            return {"content": f"Error: {str(e)}"}
+
+    @app.post("/mcp/tools/batch")
+    async def batch(request: BatchRequest):
+        """Execute several tool calls concurrently; results keep request order."""
+        return {"results": await asyncio.gather(*[
+            run_call(call.get("name", ""), call.get("args") or {}) for call in request.calls
+        ])}
+
+
+def serve(app: FastAPI, import_path: str, port: int) -> None:
+    """Run a server from its __main__ block (hypercorn with MCP_HTTP2=1, else uvicorn)."""
+    if os.environ.get("MCP_HTTP2") == "1":
+        # uvicorn has no HTTP/2; hypercorn serves cleartext h2 so clients can multiplex
+        from hypercorn.asyncio import serve as hypercorn_serve
+        from hypercorn.config import Config
+        config = Config()
+        config.bind = [f"0.0.0.0:{port}"]
+        asyncio.run(hypercorn_serve(app, config))
+        return
+
+    import uvicorn
+    # Import string (not the app object) so MCP_WORKERS > 1 can spawn workers;
+    # "auto" picks uvloop/httptools when installed (uvicorn[standard])
+    uvicorn.run(
+        import_path,
+        app_dir=str(Path(__file__).resolve().parents[1]),
+        host="0.0.0.0",
+        port=port,
+        loop="auto",
+        http="auto",
+        workers=int(os.environ.get("MCP_WORKERS", "1")),
+    )
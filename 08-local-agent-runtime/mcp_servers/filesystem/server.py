@@ -5,16 +5,278 @@ Implements Model Context Protocol for filesystem operations.
 December 2025 MCP Spec compliant.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel
+import orjson
 from typing import Optional
 from pathlib import Path
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import aiofiles
+import asyncio
+import functools
+import itertools
+import mmap
+import os
+import sys
 import re
+import time
 
-app = FastAPI(title="MCP Filesystem Server")
+# Running as a script puts this server's directory on sys.path, not the 08
+# root that holds the mcp_servers package
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from mcp_servers.common import add_batch_endpoint, serve
+
+app = FastAPI(title="MCP Filesystem Server", default_response_class=ORJSONResponse)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
+# Optional sandbox root for all tool paths, resolved once at startup.
+# Unset keeps the original behaviour: paths are taken as given.
+_FS_ROOT = os.environ.get("MCP_FS_ROOT")
+BASE_DIR = Path(_FS_ROOT).resolve() if _FS_ROOT else None
+
+# Shared pool for search_code file scans (keeps the event loop free)
+_SCAN_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="search_code")
+# Files handed to the pool per round; lets search_code stop early at max_results
+_SCAN_BATCH = 64
+# rg/ag-style skip heuristics: oversized files and NUL bytes in the first block
+_MAX_SCAN_BYTES = 2 * 1024 * 1024
+_BINARY_PROBE_BYTES = 8192
+# Files at least this large are prefiltered through mmap before being read
+_MMAP_MIN_BYTES = 256 * 1024
+# Flat (no subdirectory) search roots: path -> (py files, monotonic time)
+_FLAT_DIR_TTL = 1.0
+_flat_dir_cache: dict = {}
+
+
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse as _sre_parse
+
+
+def _extract_literal(pattern: str) -> Optional[bytes]:
+    """
+    Return the longest literal run every match of pattern must contain.
+    
+    Only top-level LITERAL runs are considered (anything inside groups,
+    alternations or repeats may be optional). Returns lowercased ASCII
+    bytes suitable for a case-insensitive prefilter, or None.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+    
+    best, run = "", []
+    for op, arg in parsed:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(arg))
+            continue
+        if len(run) > len(best):
+            best = "".join(run)
+        run = []
+    if len(run) > len(best):
+        best = "".join(run)
+    
+    if not best or not best.isascii():
+        return None
+    return best.lower().encode("ascii")
+
+
+def _has_nested_repeat(parsed, inside_repeat: bool = False) -> bool:
+    """True if an unbounded repeat appears inside another unbounded repeat."""
+    for op, arg in parsed:
+        if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            _, max_count, body = arg
+            unbounded = max_count is _sre_parse.MAXREPEAT
+            if unbounded and inside_repeat:
+                return True
+            if _has_nested_repeat(body, inside_repeat or unbounded):
+                return True
+        elif op is _sre_parse.SUBPATTERN:
+            if _has_nested_repeat(arg[-1], inside_repeat):
+                return True
+        elif op is _sre_parse.BRANCH:
+            if any(_has_nested_repeat(branch, inside_repeat) for branch in arg[1]):
+                return True
+        elif op in (_sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+            if _has_nested_repeat(arg[1], inside_repeat):
+                return True
+    return False
+
+
+def _safe_pattern(pattern: str) -> bool:
+    """
+    Reject patterns prone to catastrophic backtracking.
+    
+    Flags more than two ``.*`` runs, more than one negative lookahead, and
+    nested unbounded quantifiers such as ``(.*)+`` or ``(a+)*``.
+    """
+    if pattern.count('.*') > 2:
+        return False
+    if pattern.count('(?!') > 1:
+        return False
+    try:
+        return not _has_nested_repeat(_sre_parse.parse(pattern))
+    except Exception:
+        # Let re.compile report the syntax error
+        return True
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str, flags: int = 0) -> "tuple[re.Pattern[str], Optional[bytes]]":
+    """Compile a search pattern and its literal prefilter once per process (bounded LRU)."""
+    return re.compile(pattern, flags), _extract_literal(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _literal_bytes_pattern(literal: bytes) -> "re.Pattern[bytes]":
+    """ASCII case-insensitive finder for a prefilter literal, usable on an mmap."""
+    return re.compile(re.escape(literal), re.IGNORECASE)
+
+
+def _safe(path_str: str) -> Path:
+    """
+    Resolve a request path against BASE_DIR, rejecting escapes from it.
+    
+    Resolved on every call (never cached): a symlink swapped after a first
+    lookup must not keep passing the check.
+    """
+    if BASE_DIR is None:
+        return Path(path_str)
+    resolved = (BASE_DIR / path_str).resolve()
+    if resolved != BASE_DIR and BASE_DIR not in resolved.parents:
+        raise ValueError(f"Path outside MCP_FS_ROOT: {path_str}")
+    return resolved
+
+
+def _iter_py(root: str):
+    """
+    Yield paths of *.py files under root using cached DirEntry metadata.
+    
+    Unreadable directories are skipped, like Path.rglob does.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_py(entry.path)
+        elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def _walk_py(root: str):
+    """
+    Top level of the search_code walk.
+    
+    A root without subdirectories is listed once, non-recursively, and its
+    *.py list is reused for _FLAT_DIR_TTL seconds to absorb tight agent loops.
+    """
+    now = time.monotonic()
+    cached = _flat_dir_cache.get(root)
+    if cached is not None and now - cached[1] < _FLAT_DIR_TTL:
+        yield from cached[0]
+        return
+    
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    if not any(entry.is_dir(follow_symlinks=False) for entry in entries):
+        py_files = tuple(
+            entry.path for entry in entries
+            if entry.name.endswith(".py") and entry.is_file(follow_symlinks=False)
+        )
+        if len(_flat_dir_cache) >= 256:
+            _flat_dir_cache.clear()
+        _flat_dir_cache[root] = (py_files, now)
+        yield from py_files
+        return
+    
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_py(entry.path)
+        elif entry.name.endswith(".py") and entry.is_file(follow_symlinks=False):
+            yield entry.path
+
+
+def _line_hits(text: str, pattern: re.Pattern, path: str, max_hits: int) -> list:
+    """
+    Search a whole decoded file and report each matching line once.
+    
+    Line bounds and numbers are only computed on hits. A whole-buffer hit
+    only nominates its line: the line itself must match, so patterns like
+    ``\\s+`` never report matches that span a newline.
+    """
+    size = len(text)
+    hits = []
+    search, append = pattern.search, hits.append
+    pos, line_num, counted_to = 0, 1, 0
+    while True:
+        m = search(text, pos)
+        if m is None:
+            break
+        hit = m.start()
+        start = text.rfind('\n', 0, hit) + 1
+        end = text.find('\n', hit)
+        if end == -1:
+            end = size
+        line = text[start:end]
+        if search(line) is None:
+            # Matched only across a line break; try from the next line
+            pos = end + 1
+            if pos > size:
+                break
+            continue
+        line_num += text.count('\n', counted_to, start)
+        counted_to = start
+        append(f"{path}:{line_num}: {line.strip()}")
+        if len(hits) >= max_hits:
+            break
+        # One hit per line, like the per-line scan
+        pos = end + 1
+        if pos > size:
+            break
+    return hits
+
+
+def _scan_file(path: str, pattern: "re.Pattern[str]", literal: Optional[bytes], max_hits: int) -> list:
+    """Return up to max_hits "path:line: text" hits for one file (runs in _SCAN_POOL)."""
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size > _MAX_SCAN_BYTES:
+                return []
+            
+            # Large files: run the literal prefilter over the page cache, so
+            # files that cannot match are never copied into the Python heap
+            if literal and size >= _MMAP_MIN_BYTES:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if b'\x00' in mm[:_BINARY_PROBE_BYTES]:
+                        return []
+                    if _literal_bytes_pattern(literal).search(mm) is None:
+                        return []
+                literal = None
+            
+            head = f.read(_BINARY_PROBE_BYTES)
+            if b'\x00' in head:
+                return []
+            data = head + f.read()
+        # Cheap whole-buffer check before any per-line regex work
+        if literal and literal not in data.lower():
+            return []
+        # Every file is matched as str, so results never depend on file size
+        return _line_hits(data.decode('utf-8', errors='replace'), pattern, path, max_hits)
+    except Exception:
+        return []
+
 
 class ReadFileRequest(BaseModel):
     path: str
@@ -32,13 +294,15 @@ class ListDirectoryRequest(BaseModel):
 class SearchCodeRequest(BaseModel):
     pattern: str
     directory: str
+    max_results: int = 500
 
 
 # Tool definitions
-TOOLS = [
+TOOLS = (
     {
         "name": "read_file",
         "description": "Read contents of a file",
+        "annotations": {"readOnlyHint": True},
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -62,6 +326,7 @@ TOOLS = [
     {
         "name": "list_directory",
         "description": "List files in a directory",
+        "annotations": {"readOnlyHint": True},
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -73,36 +338,57 @@ TOOLS = [
     {
         "name": "search_code",
         "description": "Search for code patterns in files",
+        "annotations": {"readOnlyHint": True},
         "inputSchema": {
             "type": "object",
             "properties": {
                 "pattern": {"type": "string", "description": "Search pattern (regex)"},
-                "directory": {"type": "string", "description": "Directory to search"}
+                "directory": {"type": "string", "description": "Directory to search"},
+                "max_results": {"type": "integer", "description": "Maximum matches to return", "default": 500}
             },
             "required": ["pattern", "directory"]
         }
     }
-]
+)
+
+
+# Static responses, serialized once at import
+_TOOLS_JSON = orjson.dumps({"tools": TOOLS})
+_TOOLS_ETAG = f'"{hashlib.sha1(_TOOLS_JSON).hexdigest()}"'
+_HEALTH_JSON = orjson.dumps({"status": "ok", "server": "filesystem", "tools": len(TOOLS)})
 
 
 @app.get("/mcp/tools")
-async def list_tools():
-    """MCP introspection endpoint."""
-    return {"tools": TOOLS}
+async def list_tools(request: Request):
+    """MCP introspection endpoint (ETag-revalidated)."""
+    headers = {"ETag": _TOOLS_ETAG}
+    if request.headers.get("if-none-match") == _TOOLS_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(_TOOLS_JSON, media_type="application/json", headers=headers)
 
 
 @app.post("/mcp/tools/read_file")
-async def read_file(request: ReadFileRequest):
-    """Read file contents."""
+async def read_file(request: ReadFileRequest, accept: Optional[str] = Header(None)):
+    """
+    Read file contents.
+    
+    Clients that list ``application/octet-stream`` in Accept get the raw
+    bytes as a FileResponse (sendfile, no str/JSON copies), which suits
+    large files; everyone else gets the MCP ``{"content": ...}`` text payload.
+    """
     try:
-        file_path = Path(request.path)
+        file_path = _safe(request.path)
         if not file_path.exists():
             return {"content": f"Error: File not found: {request.path}"}
         
         if not file_path.is_file():
             return {"content": f"Error: Not a file: {request.path}"}
         
-        content = file_path.read_text(encoding='utf-8', errors='replace')
+        if accept and "application/octet-stream" in accept:
+            return FileResponse(file_path, media_type="application/octet-stream")
+        
+        async with aiofiles.open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+            content = await f.read()
         return {"content": content}
     except Exception as e:
         return {"content": f"Error: {str(e)}"}
@@ -112,12 +398,13 @@ async def read_file(request: ReadFileRequest):
 async def write_file(request: WriteFileRequest):
     """Write content to file."""
     try:
-        file_path = Path(request.path)
+        file_path = _safe(request.path)
         
         # Create parent directory if needed
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        file_path.write_text(request.content, encoding='utf-8')
+        async with aiofiles.open(file_path, 'w', encoding='utf-8') as f:
+            await f.write(request.content)
         return {"content": f"File written: {request.path}"}
     except Exception as e:
         return {"content": f"Error: {str(e)}"}
@@ -127,17 +414,20 @@ async def write_file(request: WriteFileRequest):
 async def list_directory(request: ListDirectoryRequest):
     """List files in directory."""
     try:
-        dir_path = Path(request.path)
+        dir_path = _safe(request.path)
         if not dir_path.exists():
             return {"content": f"Error: Directory not found: {request.path}"}
         
         if not dir_path.is_dir():
             return {"content": f"Error: Not a directory: {request.path}"}
         
-        items = []
-        for item in sorted(dir_path.iterdir()):
-            item_type = "directory" if item.is_dir() else "file"
-            items.append(f"{item_type}: {item.name}")
+        # DirEntry carries the d_type from readdir, so is_dir() needs no extra stat
+        with os.scandir(dir_path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        items = [
+            f"{'directory' if entry.is_dir() else 'file'}: {entry.name}"
+            for entry in entries
+        ]
         
         return {"content": "\n".join(items) if items else "Directory is empty"}
     except Exception as e:
@@ -148,37 +438,65 @@ async def list_directory(request: ListDirectoryRequest):
 async def search_code(request: SearchCodeRequest):
     """Search for code patterns."""
     try:
-        dir_path = Path(request.directory)
+        dir_path = _safe(request.directory)
         if not dir_path.exists():
             return {"content": f"Error: Directory not found: {request.directory}"}
         
         if not dir_path.is_dir():
             return {"content": f"Error: Not a directory: {request.directory}"}
         
-        pattern = re.compile(request.pattern, re.IGNORECASE)
+        if not _safe_pattern(request.pattern):
+            return {"content": "Error: pattern too complex"}
+        
+        flags = re.IGNORECASE | re.MULTILINE
+        pattern, literal = _compile(request.pattern, flags)
+        loop = asyncio.get_running_loop()
+        limit = max(1, request.max_results)
+        
+        # Search in Python files in rounds of _SCAN_BATCH, one pool task per
+        # file; stop walking once more than `limit` hits are collected
+        walker = _walk_py(str(dir_path))
         matches = []
+        while len(matches) <= limit:
+            py_files = await loop.run_in_executor(
+                _SCAN_POOL, lambda: list(itertools.islice(walker, _SCAN_BATCH))
+            )
+            if not py_files:
+                break
+            results = await asyncio.gather(*[
+                loop.run_in_executor(
+                    _SCAN_POOL, _scan_file, py_file, pattern, literal, limit + 1
+                )
+                for py_file in py_files
+            ])
+            for hits in results:
+                matches.extend(hits)
         
-        # Search in Python files
-        for py_file in dir_path.rglob("*.py"):
-            try:
-                content = py_file.read_text(encoding='utf-8', errors='replace')
-                for line_num, line in enumerate(content.split('\n'), 1):
-                    if pattern.search(line):
-                        matches.append(f"{py_file}:{line_num}: {line.strip()}")
-            except Exception:
-                continue
+        if len(matches) > limit:
+            return {"content": "\n".join(matches[:limit]) + f"\n... (truncated at {limit})"}
         
         return {"content": "\n".join(matches) if matches else "No matches found"}
     except Exception as e:
         return {"content": f"Error: {str(e)}"}
 
 
+# Tool name -> (handler, request model) for /mcp/tools/batch
+_DISPATCH = {
+    "read_file": (lambda req: read_file(req, accept=None), ReadFileRequest),
+    "write_file": (write_file, WriteFileRequest),
+    "list_directory": (list_directory, ListDirectoryRequest),
+    "search_code": (search_code, SearchCodeRequest),
+}
+
+
+add_batch_endpoint(app, _DISPATCH)
+
+
 @app.get("/health")
 async def health():
     """Health check."""
-    return {"status": "ok", "server": "filesystem", "tools": len(TOOLS)}
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8144)
+    serve(app, "mcp_servers.filesystem.server:app", 8144)
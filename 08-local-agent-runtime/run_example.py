@@ -47,9 +47,7 @@ def main():
         
         # Load tools
         print("\n[1] Loading tools from MCP servers...")
-        filesystem_tools = MCPToolLoader.load_from_server(server_urls["filesystem"])
-        git_tools = MCPToolLoader.load_from_server(server_urls["git"])
-        all_tools = filesystem_tools + git_tools
+        all_tools = MCPToolLoader.load_from_servers([server_urls["filesystem"], server_urls["git"]])
         
         print(f"   [OK] Loaded {len(all_tools)} tools:")
         for tool in all_tools:
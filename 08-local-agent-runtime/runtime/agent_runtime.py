@@ -10,28 +10,665 @@ December 2025 Stack:
 """
 
 from langgraph.graph import StateGraph, END
-from typing import TypedDict, Annotated, Sequence
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, ToolMessage
+from typing import Any, Dict, Optional, TypedDict, Annotated, Sequence, Union
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
+from langchain_core.messages import (
+    BaseMessage, HumanMessage, AIMessage, ToolMessage, message_chunk_to_message
+)
+from langchain_core.runnables import RunnableLambda
 from langchain_core.tools import BaseTool
+import asyncio
+import atexit
+import functools
+import hashlib
+import httpx
+import json
 import operator
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from universal_agent_tools.ollama_tools import (
-    MCPTool,
-    MCPToolLoader,
+    MCPTool as BaseMCPTool,
+    MCPToolLoader as BaseMCPToolLoader,
     create_llm_with_tools,
     parse_tool_calls_from_content,
 )
 
 # Try to import observability helper
 try:
-    import sys
-    from pathlib import Path
     sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from universal_agent_tools.observability import setup_observability
     OBSERVABILITY_AVAILABLE = True
 except ImportError:
     OBSERVABILITY_AVAILABLE = False
 
+# Optional: msgspec for fast tool-argument validation
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+# Optional: orjson for faster JSON (de)serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: ijson for streaming the content field out of large tool responses
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Optional: h2 enables HTTP/2 multiplexing on the shared MCP clients
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Optional: uvloop as the event loop for async tool loading and execution
+try:
+    import uvloop
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+
+# ===== MCP CLIENT =====
+
+# Pool size is tunable for heavily concurrent agents (MCP_MAX_CONNECTIONS / MCP_MAX_KEEPALIVE)
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=int(os.environ.get("MCP_MAX_KEEPALIVE", "100")),
+    max_connections=int(os.environ.get("MCP_MAX_CONNECTIONS", "200")),
+    keepalive_expiry=30.0,
+)
+# Built once and shared; short connect/pool timeouts make pool starvation fail fast
+_HTTP_TIMEOUT = httpx.Timeout(connect=2.0, read=10.0, write=10.0, pool=2.0)
+_LOAD_TIMEOUT = httpx.Timeout(5.0, connect=2.0, pool=2.0)
+
+# MCP_HTTP2=1: servers speak cleartext HTTP/2 (see the servers' __main__), so skip
+# HTTP/1.1 and multiplex every tool call over one connection per server
+_HTTP2_ONLY = HTTP2_AVAILABLE and os.environ.get("MCP_HTTP2") == "1"
+_CLIENT_OPTIONS = dict(
+    http1=not _HTTP2_ONLY,
+    http2=HTTP2_AVAILABLE,
+    limits=_CLIENT_LIMITS,
+    timeout=_HTTP_TIMEOUT,
+)
+
+# event loop -> AsyncClient (a pooled client is only usable on the loop that created it)
+_ASYNC_CLIENTS: dict = {}
+
+
+@functools.lru_cache(maxsize=None)
+def get_sync_client() -> httpx.Client:
+    """Process-wide HTTP client so MCP requests reuse keep-alive connections."""
+    client = httpx.Client(**_CLIENT_OPTIONS)
+    atexit.register(client.close)
+    return client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Pooled AsyncClient for the running event loop, created on first use."""
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None:
+        # Drop clients whose loop is gone (e.g. earlier asyncio.run calls)
+        for stale in [l for l in _ASYNC_CLIENTS if l.is_closed()]:
+            del _ASYNC_CLIENTS[stale]
+        client = httpx.AsyncClient(**_CLIENT_OPTIONS)
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+_JSON_HEADERS = {"content-type": "application/json", "accept": "application/json"}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize to compact JSON bytes (orjson when available)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _loads(data: bytes) -> Any:
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_response(response: httpx.Response) -> Any:
+    return _loads(response.content)
+
+
+# JSON-schema "type" -> Python type for argument structs
+_JSON_TYPE_MAP = {
+    "integer": int,
+    "boolean": bool,
+    "number": float,
+    "string": str,
+    "array": list,
+    "object": dict,
+}
+
+
+# Responses at least this large (or of unknown length) are stream-parsed when ijson is available
+_STREAM_PARSE_MIN_BYTES = 256 * 1024
+
+
+def _should_stream(response: httpx.Response) -> bool:
+    if not IJSON_AVAILABLE:
+        return False
+    length = response.headers.get("content-length")
+    return length is None or int(length) >= _STREAM_PARSE_MIN_BYTES
+
+
+class _ContentParser:
+    """Push parser returning a tool response's top-level "content" as soon as it is complete."""
+    
+    def __init__(self):
+        self._found = ijson.sendable_list()
+        # Floats, not Decimals, so values match the buffered _loads parse
+        self._coro = ijson.items_coro(self._found, "content", use_float=True)
+        self._chunks = []
+    
+    def feed(self, chunk: bytes) -> Any:
+        """Parse one chunk; return the content value once complete, else None."""
+        self._chunks.append(chunk)
+        self._coro.send(chunk)
+        return self._found[0] if self._found else None
+    
+    def finish(self) -> Any:
+        # No content field: fall back to the whole payload, as the buffered path does
+        result = _loads(b"".join(self._chunks))
+        return result.get("content", str(result))
+
+
+def _build_args_struct(input_schema: Dict[str, Any]):
+    """
+    msgspec Struct mirroring an MCP inputSchema (None if unavailable/empty).
+    
+    Structs are shared between tools with identical schemas, so reloading a
+    server or exposing the same shape under several names builds one type.
+    """
+    properties = (input_schema or {}).get("properties")
+    if not MSGSPEC_AVAILABLE or not properties:
+        return None
+    
+    key = json.dumps(
+        [properties, sorted(input_schema.get("required", []))],
+        sort_keys=True, separators=(",", ":"), default=str
+    )
+    return _args_struct_for(key)
+
+
+def _build_fast_check(input_schema: Dict[str, Any]) -> Optional[tuple]:
+    """
+    (required names, {name: type}) for schemas made only of scalar properties, else None.
+    
+    Calls whose arguments are all known and exactly typed are accepted with
+    a few type() checks instead of a msgspec conversion; anything else
+    (including None for optional arguments) falls back to msgspec.
+    """
+    properties = (input_schema or {}).get("properties")
+    if not properties:
+        return None
+    types = {}
+    for prop_name, prop_def in properties.items():
+        prop_type = _JSON_TYPE_MAP.get(prop_def.get("type"))
+        if prop_type not in (str, int, bool):
+            return None
+        types[prop_name] = prop_type
+    return frozenset(input_schema.get("required", [])), types
+
+
+@functools.lru_cache(maxsize=256)
+def _args_struct_for(schema_key: str):
+    properties, required = json.loads(schema_key)
+    required = set(required)
+    fields = []
+    for prop_name, prop_def in properties.items():
+        prop_type = _JSON_TYPE_MAP.get(prop_def.get("type"), str)
+        if prop_name in required:
+            fields.append((prop_name, prop_type))
+        else:
+            fields.append((prop_name, Optional[prop_type], None))
+    digest = hashlib.sha1(schema_key.encode()).hexdigest()[:12]
+    return msgspec.defstruct(f"Args_{digest}", fields, kw_only=True)
+
+
+# Results of read-only tools (MCP readOnlyHint), reused for MCP_RESULT_TTL seconds (0 disables)
+_RESULT_TTL = float(os.environ.get("MCP_RESULT_TTL", "30"))
+_RESULT_CACHE_SIZE = 512
+# Tool replies that report a failure rather than a result are never cached
+_ERROR_PREFIXES = ("Error", "HTTP error")
+
+
+class _ResultCache:
+    """
+    Thread-safe LRU of (server_url, tool, canonical args) -> content.
+    
+    Any write clears every server's entries, since tools on one server can
+    change what another reports (write_file vs git_status). A read that
+    started before that write cannot store its result afterwards: put()
+    only accepts results from the current generation.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+    
+    def get(self, key: tuple) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+    
+    def put(self, key: tuple, content: str, generation: int) -> None:
+        if content.startswith(_ERROR_PREFIXES):
+            return
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (content, time.monotonic())
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+_RESULT_CACHE = _ResultCache(_RESULT_CACHE_SIZE, _RESULT_TTL)
+
+
+class MCPTool(BaseMCPTool):
+    """
+    MCPTool without a per-tool Pydantic model.
+    
+    The MCP inputSchema is passed straight through as a JSON-schema
+    ``args_schema`` (LangChain binds it as-is and skips Pydantic coercion);
+    arguments are checked against a msgspec Struct built once per tool.
+    Calls go through the shared pooled clients rather than a client per call.
+    Results of read-only tools are cached until any non-read-only tool
+    runs (or MCP_RESULT_TTL expires).
+    """
+    
+    def __init__(
+        self,
+        server_url: str,
+        tool_name: str,
+        input_schema: Dict[str, Any],
+        name: Optional[str] = None,
+        description: str = "",
+        read_only: bool = False
+    ):
+        BaseTool.__init__(
+            self,
+            name=name or tool_name,
+            description=description,
+            args_schema=input_schema if input_schema.get("properties") else None
+        )
+        object.__setattr__(self, '_server_url', server_url)
+        object.__setattr__(self, '_tool_name', tool_name)
+        object.__setattr__(self, '_post_url', f"{server_url}/tools/{tool_name}")
+        object.__setattr__(self, '_input_schema', input_schema)
+        object.__setattr__(self, '_args_struct', _build_args_struct(input_schema))
+        object.__setattr__(self, '_fast_check', _build_fast_check(input_schema))
+        object.__setattr__(self, '_read_only', read_only)
+        object.__setattr__(self, '_cache_results', read_only and _RESULT_TTL > 0)
+    
+    def _validate_args(self, kwargs: Dict[str, Any]) -> Optional[str]:
+        """Return an error message if kwargs don't match the schema, else None."""
+        if self._args_struct is None:
+            return None
+        fast_check = self._fast_check
+        if fast_check is not None:
+            required, types = fast_check
+            if required <= kwargs.keys() and all(
+                type(value) is types.get(name) for name, value in kwargs.items()
+            ):
+                return None
+        try:
+            msgspec.convert(kwargs, self._args_struct, strict=False)
+        except msgspec.ValidationError as e:
+            return f"Invalid arguments for {self._tool_name}: {e}"
+        return None
+    
+    def _result_key(self, kwargs: Dict[str, Any]) -> tuple:
+        args = json.dumps(kwargs, sort_keys=True, separators=(",", ":"), default=str)
+        return (self._server_url, self._tool_name, args)
+    
+    def _post(self, kwargs: Dict[str, Any]) -> str:
+        with get_sync_client().stream(
+            "POST", self._post_url, content=_dumps(kwargs), headers=_JSON_HEADERS
+        ) as response:
+            response.raise_for_status()
+            if _should_stream(response):
+                parser = _ContentParser()
+                for chunk in response.iter_bytes():
+                    content = parser.feed(chunk)
+                    if content is not None:
+                        return content
+                return parser.finish()
+            result = _loads(response.read())
+        return result.get("content", str(result))
+    
+    async def _apost(self, kwargs: Dict[str, Any]) -> str:
+        async with get_async_client().stream(
+            "POST", self._post_url, content=_dumps(kwargs), headers=_JSON_HEADERS
+        ) as response:
+            response.raise_for_status()
+            if _should_stream(response):
+                parser = _ContentParser()
+                async for chunk in response.aiter_bytes():
+                    content = parser.feed(chunk)
+                    if content is not None:
+                        return content
+                return parser.finish()
+            result = _loads(await response.aread())
+        return result.get("content", str(result))
+    
+    def _before_call(self, kwargs: Dict[str, Any]):
+        """(early reply or None, cache key or None, cache generation) for one call."""
+        error = self._validate_args(kwargs)
+        if error:
+            return error, None, None
+        if not self._cache_results:
+            return None, None, None
+        key = self._result_key(kwargs)
+        return _RESULT_CACHE.get(key), key, _RESULT_CACHE.generation
+    
+    def _after_call(self, key: Optional[tuple], generation: Optional[int], content: Optional[str]) -> None:
+        if key is None:
+            # This call may have changed state on any server
+            _RESULT_CACHE.invalidate()
+        elif content is not None:
+            _RESULT_CACHE.put(key, content, generation)
+    
+    def _run(self, **kwargs) -> str:
+        early, key, generation = self._before_call(kwargs)
+        if early is not None:
+            return early
+        content = None
+        try:
+            content = self._post(kwargs)
+            return content
+        except httpx.HTTPError as e:
+            return f"HTTP error executing tool: {str(e)}"
+        except Exception as e:
+            return f"Error executing tool: {str(e)}"
+        finally:
+            self._after_call(key, generation, content)
+    
+    async def _arun(self, **kwargs) -> str:
+        early, key, generation = self._before_call(kwargs)
+        if early is not None:
+            return early
+        content = None
+        try:
+            content = await self._apost(kwargs)
+            return content
+        except httpx.HTTPError as e:
+            return f"HTTP error executing tool: {str(e)}"
+        except Exception as e:
+            return f"Error executing tool: {str(e)}"
+        finally:
+            self._after_call(key, generation, content)
+
+
+# On-disk introspection cache, shared across runs (MCP_SCHEMA_TTL=0 disables it)
+_TOOLS_CACHE_DIR = Path(tempfile.gettempdir()) / "mcp_schema"
+_TOOLS_CACHE_TTL = float(os.environ.get("MCP_SCHEMA_TTL", "300"))
+
+# server_url -> (ETag, loaded tools, raw tool defs, monotonic time last checked)
+_INTROSPECTION_CACHE: dict = {}
+
+
+def _tools_cache_path(server_url: str) -> Path:
+    return _TOOLS_CACHE_DIR / f"{hashlib.sha256(server_url.encode()).hexdigest()}.json"
+
+
+def _read_tools_cache(server_url: str):
+    """Return (etag, tool_defs, age_seconds) from the disk cache, or None."""
+    if _TOOLS_CACHE_TTL <= 0:
+        return None
+    path = _tools_cache_path(server_url)
+    try:
+        age = time.time() - path.stat().st_mtime
+        raw = path.read_bytes()
+        entry = _loads(raw)
+        return entry.get("etag"), entry["tools"], age
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_tools_cache(server_url: str, etag: Optional[str], tool_defs: list) -> None:
+    if _TOOLS_CACHE_TTL <= 0:
+        return
+    entry = {"etag": etag, "tools": tool_defs}
+    path = _tools_cache_path(server_url)
+    try:
+        _TOOLS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write then rename so concurrent readers never see a partial file
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(_dumps(entry))
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+class MCPToolLoader(BaseMCPToolLoader):
+    """
+    MCPToolLoader with a shared HTTP client and cached introspection.
+    
+    Tool definitions are kept in memory and on disk for MCP_SCHEMA_TTL seconds
+    (default 300), so warm starts skip the /tools request entirely. Once stale,
+    the server is revalidated with If-None-Match; on 304 the cached tools are
+    reused without re-parsing the schema or rebuilding tools.
+    """
+    
+    @staticmethod
+    def _build_tools(server_url: str, tool_defs: list) -> list[BaseTool]:
+        return [
+            MCPTool(
+                server_url=server_url,
+                tool_name=tool_def["name"],
+                input_schema=tool_def.get("inputSchema", {}),
+                name=tool_def["name"],
+                description=tool_def.get("description", ""),
+                read_only=bool(tool_def.get("annotations", {}).get("readOnlyHint"))
+            )
+            for tool_def in tool_defs
+        ]
+    
+    @staticmethod
+    def _cached_entry(server_url: str, now: float):
+        """In-memory cache entry for server_url, seeded from disk on first use."""
+        cached = _INTROSPECTION_CACHE.get(server_url)
+        if cached is None:
+            disk = _read_tools_cache(server_url)
+            if disk is not None:
+                etag, tool_defs, age = disk
+                tools = MCPToolLoader._build_tools(server_url, tool_defs)
+                cached = (etag, tuple(tools), tool_defs, now - age)
+                _INTROSPECTION_CACHE[server_url] = cached
+        return cached
+    
+    @staticmethod
+    def _from_response(server_url: str, response: httpx.Response, cached, now: float) -> list[BaseTool]:
+        if cached and response.status_code == 304:
+            _INTROSPECTION_CACHE[server_url] = (*cached[:3], now)
+            _write_tools_cache(server_url, cached[0], cached[2])
+            return list(cached[1])
+        response.raise_for_status()
+        
+        tool_defs = _json_response(response).get("tools", [])
+        tools = MCPToolLoader._build_tools(server_url, tool_defs)
+        
+        etag = response.headers.get("ETag")
+        _INTROSPECTION_CACHE[server_url] = (etag, tuple(tools), tool_defs, now)
+        _write_tools_cache(server_url, etag, tool_defs)
+        return tools
+    
+    @staticmethod
+    def _revalidation_headers(cached) -> Dict[str, str]:
+        return {"If-None-Match": cached[0]} if cached and cached[0] else {}
+    
+    @staticmethod
+    def load_from_server(server_url: str, timeout: Union[float, httpx.Timeout] = _LOAD_TIMEOUT) -> list[BaseTool]:
+        now = time.monotonic()
+        cached = MCPToolLoader._cached_entry(server_url, now)
+        if cached and now - cached[3] < _TOOLS_CACHE_TTL:
+            return list(cached[1])
+        headers = MCPToolLoader._revalidation_headers(cached)
+        
+        try:
+            response = get_sync_client().get(f"{server_url}/tools", headers=headers, timeout=timeout)
+            return MCPToolLoader._from_response(server_url, response, cached, now)
+            
+        except httpx.HTTPError as e:
+            raise httpx.HTTPError(
+                f"Failed to load tools from {server_url}: {e}"
+            ) from e
+        except Exception as e:
+            # Log warning but don't fail completely
+            print(f"Warning: Could not load tools from {server_url}: {e}")
+            return []
+    
+    @staticmethod
+    async def load_from_server_async(server_url: str, timeout: Union[float, httpx.Timeout] = _LOAD_TIMEOUT) -> list[BaseTool]:
+        """Async load_from_server, so several servers can be introspected concurrently."""
+        now = time.monotonic()
+        cached = MCPToolLoader._cached_entry(server_url, now)
+        if cached and now - cached[3] < _TOOLS_CACHE_TTL:
+            return list(cached[1])
+        headers = MCPToolLoader._revalidation_headers(cached)
+        
+        try:
+            response = await get_async_client().get(f"{server_url}/tools", headers=headers, timeout=timeout)
+            return MCPToolLoader._from_response(server_url, response, cached, now)
+            
+        except httpx.HTTPError as e:
+            raise httpx.HTTPError(
+                f"Failed to load tools from {server_url}: {e}"
+            ) from e
+        except Exception as e:
+            print(f"Warning: Could not load tools from {server_url}: {e}")
+            return []
+    
+    @staticmethod
+    async def load_from_servers_async(server_urls: list[str], timeout: Union[float, httpx.Timeout] = _LOAD_TIMEOUT) -> list[BaseTool]:
+        """Introspect all servers concurrently; an unreachable server is skipped with a warning."""
+        results = await asyncio.gather(
+            *(MCPToolLoader.load_from_server_async(url, timeout) for url in server_urls),
+            return_exceptions=True
+        )
+        tools = []
+        for url, result in zip(server_urls, results):
+            if isinstance(result, BaseException):
+                print(f"Warning: Could not load tools from {url}: {result}")
+                continue
+            tools.extend(result)
+        return tools
+    
+    @staticmethod
+    def load_from_servers(server_urls: list[str], timeout: Union[float, httpx.Timeout] = _LOAD_TIMEOUT) -> list[BaseTool]:
+        """Sync wrapper around load_from_servers_async (not for use inside a running loop)."""
+        return asyncio.run(MCPToolLoader.load_from_servers_async(server_urls, timeout))
+
+
+# ===== LAZY TOOL SCHEMAS =====
+
+_LAZY_DESCRIPTION_CHARS = 80
+
+_SCHEMA_TOOL_ARGS = {
+    "type": "object",
+    "properties": {"name": {"type": "string", "description": "Name of the tool to describe"}},
+    "required": ["name"],
+}
+
+
+class ToolSchemaTool(BaseTool):
+    """Synthetic get_tool_schema tool: returns the full parameter schema of a tool on demand."""
+    
+    name: str = "get_tool_schema"
+    description: str = (
+        "Return the full JSON parameter schema of a tool. "
+        "Call this before using a tool whose parameters you don't know."
+    )
+    schemas: Dict[str, Any]
+    
+    def _run(self, name: str) -> str:
+        schema = self.schemas.get(name)
+        if schema is None:
+            return f"Tool {name} not found"
+        return _dumps(schema).decode()
+    
+    async def _arun(self, name: str) -> str:
+        return self._run(name)
+
+
+def _light_tool_spec(tool: BaseTool) -> Dict[str, Any]:
+    """OpenAI-style function spec with a short description and no parameter schema."""
+    description = tool.description
+    if len(description) > _LAZY_DESCRIPTION_CHARS:
+        description = description[:_LAZY_DESCRIPTION_CHARS - 3] + "..."
+    return {
+        "type": "function",
+        "function": {
+            "name": tool.name,
+            "description": description,
+            "parameters": {"type": "object", "properties": {}, "additionalProperties": True},
+        },
+    }
+
+
+def create_llm_with_lazy_tools(tools: list[BaseTool], **kwargs):
+    """
+    Like create_llm_with_tools, but bind only tool names and short descriptions.
+    
+    Full parameter schemas stay out of every prompt; the model fetches the
+    one it needs through get_tool_schema. Tool calls are still executed by
+    name against the original tools.
+    
+    Returns:
+        (llm, tools) where tools includes the get_tool_schema tool, for
+        passing to create_agent_graph
+    """
+    schema_tool = ToolSchemaTool(
+        schemas={
+            t.name: {
+                "description": t.description,
+                "parameters": getattr(t, "_input_schema", None) or t.args,
+            }
+            for t in tools
+        },
+        args_schema=_SCHEMA_TOOL_ARGS,
+    )
+    llm, _ = create_llm_with_tools([*map(_light_tool_spec, tools), schema_tool], **kwargs)
+    return llm, [*tools, schema_tool]
+
 
 # ===== STATE =====
 
@@ -42,6 +679,18 @@ class AgentState(TypedDict):
 
 # ===== LANGGRAPH NODES =====
 
+def _may_contain_tool_call(content: str, tools: list[BaseTool]) -> bool:
+    """
+    Cheap check that content could hold a JSON tool call before running the parser.
+    
+    The parser only accepts calls to known tools, so a reply that names none
+    of them (the usual final answer) is returned without a JSON parse attempt.
+    """
+    if "{" not in content or '"name"' not in content:
+        return False
+    return any(tool.name in content for tool in tools)
+
+
 def agent_node(state: AgentState, llm, tools: list[BaseTool]):
     """Agent node: LLM decides what to do."""
     messages = state["messages"]
@@ -65,24 +714,20 @@ def agent_node(state: AgentState, llm, tools: list[BaseTool]):
     try:
         response = llm.invoke(messages)
         
-        # Check if response has tool_calls (from bind_tools)
-        if hasattr(response, "tool_calls") and response.tool_calls:
-            return {"messages": [response]}
-        
         # CRITICAL FIX: Parse tool calls from content if Ollama returned them as JSON
         # Ollama's /v1 API sometimes returns tool calls in content instead of tool_calls
-        if hasattr(response, "content") and response.content:
-            parsed_tool_calls = parse_tool_calls_from_content(response.content, tools)
+        # (skipped when bind_tools already produced tool_calls or for plain text answers)
+        content = getattr(response, "content", None)
+        if (
+            not getattr(response, "tool_calls", None)
+            and isinstance(content, str)
+            and _may_contain_tool_call(content, tools)
+        ):
+            parsed_tool_calls = parse_tool_calls_from_content(content, tools)
             if parsed_tool_calls:
-                # Create new AIMessage with tool_calls
-                from langchain_core.messages import AIMessage
-                response_with_tools = AIMessage(
-                    content=response.content,  # Keep original content
-                    tool_calls=parsed_tool_calls
-                )
-                return {"messages": [response_with_tools]}
+                # Create new AIMessage with tool_calls, keeping the original content
+                response = AIMessage(content=content, tool_calls=parsed_tool_calls)
         
-        # If no tool calls, return the response as-is
         return {"messages": [response]}
         
     except Exception as e:
@@ -96,60 +741,164 @@ def agent_node(state: AgentState, llm, tools: list[BaseTool]):
         }
 
 
-def tool_node(state: AgentState, tools: list[BaseTool]):
-    """Tool node: Execute tool calls."""
-    last_message = state["messages"][-1]
+def _index_tools(tools: list[BaseTool]) -> Dict[str, BaseTool]:
+    """Map interned tool names to tools, built once per graph."""
+    return {sys.intern(t.name): t for t in tools}
+
+
+def _find_tool(tool_call: dict, tools_by_name: Dict[str, BaseTool]):
+    """
+    Resolve a tool call against the loaded tools.
     
-    tool_messages = []
+    Returns:
+        (tool, tool_id, error) where error is a ToolMessage when the tool
+        is unknown or not an MCP tool, else None
+    """
+    tool_name = tool_call["name"]
+    tool_id = tool_call.get("id", tool_name)
     
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-        for tool_call in last_message.tool_calls:
-            tool_name = tool_call["name"]
-            tool_args = tool_call.get("args", {})
-            tool_id = tool_call.get("id", tool_name)
-            
-            # Find the tool
-            tool = next((t for t in tools if t.name == tool_name), None)
-            
-            if tool:
-                # Verify tool has required attributes
-                if not hasattr(tool, '_server_url'):
-                    tool_messages.append(
-                        ToolMessage(
-                            content=f"Error: Tool {tool_name} missing _server_url attribute. Tool type: {type(tool).__name__}",
-                            tool_call_id=tool_id
-                        )
-                    )
-                    continue
-                
-                # Execute tool
-                try:
-                    result = tool._run(**tool_args)
-                except Exception as e:
-                    result = f"Error executing tool: {str(e)}"
-                
-                tool_messages.append(
-                    ToolMessage(
-                        content=str(result),
-                        tool_call_id=tool_id
-                    )
-                )
-            else:
-                tool_messages.append(
-                    ToolMessage(
-                        content=f"Tool {tool_name} not found",
-                        tool_call_id=tool_id
-                    )
-                )
+    tool = tools_by_name.get(sys.intern(tool_name))
+    if tool is None:
+        return None, tool_id, ToolMessage(
+            content=f"Tool {tool_name} not found",
+            tool_call_id=tool_id
+        )
+    
+    # Verify tool has required attributes
+    if not isinstance(tool, ToolSchemaTool) and not hasattr(tool, '_server_url'):
+        return None, tool_id, ToolMessage(
+            content=f"Error: Tool {tool_name} missing _server_url attribute. Tool type: {type(tool).__name__}",
+            tool_call_id=tool_id
+        )
+    
+    return tool, tool_id, None
+
+
+def _execute_tool_call(tool_call: dict, tools_by_name: Dict[str, BaseTool]) -> ToolMessage:
+    """Execute one tool call; failures become a ToolMessage."""
+    tool, tool_id, error = _find_tool(tool_call, tools_by_name)
+    if error is not None:
+        return error
+    
+    # Execute tool
+    try:
+        result = tool._run(**tool_call.get("args", {}))
+    except Exception as e:
+        result = f"Error executing tool: {str(e)}"
+    
+    return ToolMessage(content=str(result), tool_call_id=tool_id)
+
+
+# Threads for fanning out tool calls on the sync invoke() path
+_TOOL_POOL = ThreadPoolExecutor(thread_name_prefix="mcp-tool")
+
+
+def _can_run_concurrently(tool_calls: list, tools_by_name: Dict[str, BaseTool]) -> bool:
+    """
+    True if every call goes to a read-only tool (MCP readOnlyHint).
+    
+    Anything else (write_file then git_commit, ...) may depend on the
+    order the model emitted, so it runs sequentially.
+    """
+    for tool_call in tool_calls:
+        tool = tools_by_name.get(tool_call.get("name"))
+        if not (isinstance(tool, ToolSchemaTool) or getattr(tool, "_read_only", False)):
+            return False
+    return True
+
+
+def tool_node(state: AgentState, tools_by_name: Dict[str, BaseTool]):
+    """Tool node: Execute tool calls (read-only batches run concurrently on a thread pool)."""
+    tool_calls = getattr(state["messages"][-1], "tool_calls", None)
+    if not tool_calls:
+        return {"messages": []}
+    
+    if len(tool_calls) == 1 or not _can_run_concurrently(tool_calls, tools_by_name):
+        return {"messages": [
+            _execute_tool_call(tool_call, tools_by_name) for tool_call in tool_calls
+        ]}
+    
+    # map preserves order, so ToolMessages line up with tool_calls
+    tool_messages = _TOOL_POOL.map(
+        functools.partial(_execute_tool_call, tools_by_name=tools_by_name), tool_calls
+    )
+    return {"messages": list(tool_messages)}
+
+
+async def _aexecute_tool_call(tool_call: dict, tools_by_name: Dict[str, BaseTool]) -> ToolMessage:
+    """Execute one tool call; failures become a ToolMessage so gather never aborts."""
+    tool, tool_id, error = _find_tool(tool_call, tools_by_name)
+    if error is not None:
+        return error
+    
+    try:
+        result = await tool._arun(**tool_call.get("args", {}))
+    except Exception as e:
+        result = f"Error executing tool: {str(e)}"
     
-    return {"messages": tool_messages}
+    return ToolMessage(content=str(result), tool_call_id=tool_id)
+
+
+async def atool_node(state: AgentState, tools_by_name: Dict[str, BaseTool]):
+    """Async tool node: Execute tool calls (read-only batches run concurrently)."""
+    tool_calls = getattr(state["messages"][-1], "tool_calls", None)
+    if not tool_calls:
+        return {"messages": []}
+    
+    if not _can_run_concurrently(tool_calls, tools_by_name):
+        return {"messages": [
+            await _aexecute_tool_call(tool_call, tools_by_name) for tool_call in tool_calls
+        ]}
+    
+    # gather preserves order, so ToolMessages line up with tool_calls
+    tool_messages = await asyncio.gather(
+        *(_aexecute_tool_call(tool_call, tools_by_name) for tool_call in tool_calls)
+    )
+    return {"messages": list(tool_messages)}
+
+
+async def aagent_node(state: AgentState, llm, tools: list[BaseTool]):
+    """
+    Async agent node: stream the LLM reply.
+    
+    Only the model call differs from agent_node; tool calls are left to the
+    tools node, so sync and async runs share one graph topology.
+    """
+    if llm is None:
+        return agent_node(state, llm, tools)
+    
+    try:
+        full = None
+        async for chunk in llm.astream(state["messages"]):
+            full = chunk if full is None else full + chunk
+        
+        response = message_chunk_to_message(full) if full is not None else AIMessage(content="")
+        
+        # Parse tool calls from content if Ollama returned them as JSON
+        content = response.content
+        if not response.tool_calls and isinstance(content, str) and _may_contain_tool_call(content, tools):
+            parsed_tool_calls = parse_tool_calls_from_content(content, tools)
+            if parsed_tool_calls:
+                response = AIMessage(content=content, tool_calls=parsed_tool_calls)
+        
+        return {"messages": [response]}
+        
+    except Exception as e:
+        # Fallback: return a simple response
+        return {
+            "messages": [
+                AIMessage(
+                    content=f"I understand. Available tools: {', '.join([t.name for t in tools])}",
+                )
+            ]
+        }
 
 
 def should_continue(state: AgentState):
     """Conditional edge: Continue to tools or end."""
     last_message = state["messages"][-1]
     
-    if hasattr(last_message, "tool_calls") and last_message.tool_calls:
+    if getattr(last_message, "tool_calls", None):
         return "tools"
     else:
         return "end"
@@ -157,17 +906,44 @@ def should_continue(state: AgentState):
 
 # ===== GRAPH BUILDING =====
 
+# (tool ids, llm id) -> (tools, llm, compiled graph); the objects are kept so ids stay valid
+_GRAPH_CACHE: dict = {}
+_GRAPH_CACHE_SIZE = 8
+
+
 def create_agent_graph(tools: list[BaseTool], llm):
     """
     Create LangGraph agent with MCP tools.
     
-    This is what the compiler would generate from Fabric YAML.
+    This is what the compiler would generate from Fabric YAML. The compiled
+    graph is reused for repeat calls with the same tool objects and LLM.
     """
+    key = (tuple(map(id, tools)), id(llm))
+    cached = _GRAPH_CACHE.get(key)
+    if cached is not None:
+        return cached[2]
+    
+    agent = _build_agent_graph(tools, llm)
+    if len(_GRAPH_CACHE) >= _GRAPH_CACHE_SIZE:
+        del _GRAPH_CACHE[next(iter(_GRAPH_CACHE))]
+    _GRAPH_CACHE[key] = (tuple(tools), llm, agent)
+    return agent
+
+
+def _build_agent_graph(tools: list[BaseTool], llm):
     graph = StateGraph(AgentState)
+    tools_by_name = _index_tools(tools)
     
-    # Add nodes
-    graph.add_node("agent", lambda state: agent_node(state, llm, tools))
-    graph.add_node("tools", lambda state: tool_node(state, tools))
+    # Add nodes (ainvoke() streams the LLM reply)
+    graph.add_node("agent", RunnableLambda(
+        functools.partial(agent_node, llm=llm, tools=tools),
+        afunc=functools.partial(aagent_node, llm=llm, tools=tools)
+    ))
+    # Sync invoke() runs tool_node; ainvoke() fans tool calls out concurrently
+    graph.add_node("tools", RunnableLambda(
+        functools.partial(tool_node, tools_by_name=tools_by_name),
+        afunc=functools.partial(atool_node, tools_by_name=tools_by_name)
+    ))
     
     # Add edges
     graph.set_entry_point("agent")
@@ -188,20 +964,25 @@ def create_agent_graph(tools: list[BaseTool], llm):
 
 # ===== MAIN RUNTIME =====
 
-def main():
+async def main_async():
     """Main runtime - demonstrates the full stack."""
     # Setup observability
     if OBSERVABILITY_AVAILABLE:
         setup_observability("local-agent-runtime")
     
+    # Identical LLM requests (same model, params and messages) are served from memory
+    if get_llm_cache() is None:
+        set_llm_cache(InMemoryCache())
+    
     print("[START] Local Agent Runtime - December 2025 Stack")
     print("=" * 60)
     
     # 1. Load tools from MCP servers (auto-discovery)
     print("\n1. Loading tools from MCP servers...")
-    filesystem_tools = MCPToolLoader.load_from_server("http://localhost:8144/mcp")
-    git_tools = MCPToolLoader.load_from_server("http://localhost:8145/mcp")
-    all_tools = filesystem_tools + git_tools
+    all_tools = await MCPToolLoader.load_from_servers_async([
+        "http://localhost:8144/mcp",
+        "http://localhost:8145/mcp",
+    ])
     
     print(f"   [OK] Loaded {len(all_tools)} tools:")
     for tool in all_tools:
@@ -209,7 +990,11 @@ def main():
     
     # 2. Create LLM with tools (Ollama function calling)
     print("\n2. Initializing Ollama LLM with function calling...")
-    llm, _ = create_llm_with_tools(all_tools, model="llama3.2:11b")
+    if os.environ.get("MCP_LAZY_SCHEMAS") == "1":
+        # Bind names/descriptions only; schemas are fetched via get_tool_schema
+        llm, all_tools = create_llm_with_lazy_tools(all_tools, model="llama3.2:11b")
+    else:
+        llm, _ = create_llm_with_tools(all_tools, model="llama3.2:11b")
     print("   [OK] LLM ready with tool binding")
     
     # 3. Create LangGraph agent
@@ -222,11 +1007,13 @@ def main():
     print("   (This would be invoked from the compiler-generated code)")
     
     # Example invocation
-    result = agent.invoke({
+    request = {
         "messages": [
             HumanMessage(content="Find all TODO comments in the codebase")
         ]
-    })
+    }
+    # Several concurrent requests can go through agent.abatch directly
+    result = await agent.ainvoke(request)
     
     print("\n[OK] Agent execution complete!")
     print(f"   Messages: {len(result['messages'])}")
@@ -234,6 +1021,12 @@ def main():
     return agent
 
 
+def main():
+    """Synchronous entry point: runs main_async on uvloop when installed."""
+    if UVLOOP_AVAILABLE:
+        return uvloop.run(main_async())
+    return asyncio.run(main_async())
+
+
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,384 @@
+"""
+Unit tests for the MCP server helpers and the runtime result cache
+
+No servers or LLM needed: the helpers are called directly.
+"""
+
+import asyncio
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add runtime to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from mcp_servers.filesystem import server as fs_server
+from mcp_servers.git import server as git_server
+from runtime import agent_runtime
+from runtime.agent_runtime import MCPTool, _ResultCache
+from langchain_core.messages import AIMessage
+
+_SEARCH_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+# ===== filesystem: _safe =====
+
+def test_safe_without_root_passes_paths_through(monkeypatch):
+    monkeypatch.setattr(fs_server, "BASE_DIR", None)
+    assert fs_server._safe("../anywhere") == Path("../anywhere")
+
+
+def test_safe_rejects_escapes(monkeypatch, tmp_path):
+    root = tmp_path.resolve()
+    monkeypatch.setattr(fs_server, "BASE_DIR", root)
+
+    assert fs_server._safe("a/b.txt") == root / "a" / "b.txt"
+    assert fs_server._safe(".") == root
+    with pytest.raises(ValueError):
+        fs_server._safe("../outside.txt")
+    with pytest.raises(ValueError):
+        fs_server._safe("/etc/passwd")
+
+
+def test_safe_rechecks_swapped_symlink(monkeypatch, tmp_path):
+    root = (tmp_path / "root").resolve()
+    inside = root / "inside"
+    outside = (tmp_path / "outside").resolve()
+    inside.mkdir(parents=True)
+    outside.mkdir()
+    link = root / "link"
+    link.symlink_to(inside)
+    monkeypatch.setattr(fs_server, "BASE_DIR", root)
+
+    assert fs_server._safe("link/file.txt") == inside / "file.txt"
+
+    link.unlink()
+    link.symlink_to(outside)
+    with pytest.raises(ValueError):
+        fs_server._safe("link/file.txt")
+
+
+# ===== filesystem: search helpers =====
+
+def test_compile_reuses_the_compiled_pattern():
+    first, _ = fs_server._compile(r"def \w+", _SEARCH_FLAGS)
+    second, _ = fs_server._compile(r"def \w+", _SEARCH_FLAGS)
+    assert first is second
+    assert first.flags & re.IGNORECASE
+
+    other, _ = fs_server._compile(r"def \w+", 0)
+    assert other is not first
+
+
+def test_search_code_skips_unreadable_directories(monkeypatch, tmp_path):
+    (tmp_path / "ok").mkdir()
+    (tmp_path / "ok" / "a.py").write_text("needle = 1\n")
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "b.py").write_text("needle = 2\n")
+    locked = str(tmp_path / "locked")
+    scandir = os.scandir
+
+    def guarded_scandir(path="."):
+        if os.fspath(path) == locked:
+            raise PermissionError(13, "Permission denied", locked)
+        return scandir(path)
+
+    monkeypatch.setattr(fs_server, "BASE_DIR", None)
+    monkeypatch.setattr(fs_server.os, "scandir", guarded_scandir)
+    result = asyncio.run(fs_server.search_code(
+        fs_server.SearchCodeRequest(pattern="needle", directory=str(tmp_path))
+    ))
+    assert result == {"content": f"{tmp_path / 'ok' / 'a.py'}:1: needle = 1"}
+
+
+def test_line_hits_reports_each_line_once_with_numbers():
+    text = "alpha\nbeta beta\ngamma\nbeta\n"
+    pattern = re.compile("beta", _SEARCH_FLAGS)
+    assert fs_server._line_hits(text, pattern, "f.py", 10) == [
+        "f.py:2: beta beta",
+        "f.py:4: beta",
+    ]
+
+
+def test_line_hits_never_matches_across_lines():
+    text = "x = 1   \n    y = 2\nz=3\n"
+    pattern = re.compile(r"1\s+y", _SEARCH_FLAGS)
+    assert fs_server._line_hits(text, pattern, "f.py", 10) == []
+
+    pattern = re.compile(r"=\s+\d", _SEARCH_FLAGS)
+    assert fs_server._line_hits(text, pattern, "f.py", 10) == [
+        "f.py:1: x = 1",
+        "f.py:2: y = 2",
+    ]
+
+
+def test_line_hits_stops_at_max_hits():
+    text = "hit\n" * 20
+    pattern = re.compile("hit", _SEARCH_FLAGS)
+    assert len(fs_server._line_hits(text, pattern, "f.py", 5)) == 5
+
+
+@pytest.mark.parametrize("pattern", [
+    "(.*)+",
+    "(a+)*",
+    "(?:x*)*y",
+    ".*a.*b.*c.*",
+    "(?!a)(?!b)c",
+])
+def test_safe_pattern_rejects_backtracking_prone_patterns(pattern):
+    assert not fs_server._safe_pattern(pattern)
+
+
+@pytest.mark.parametrize("pattern", [
+    "def ",
+    r"class \w+\(",
+    "import .*os",
+    "(foo|bar)+",
+    "unbalanced(",
+])
+def test_safe_pattern_accepts_ordinary_patterns(pattern):
+    assert fs_server._safe_pattern(pattern)
+
+
+def test_scan_file_skips_binary_files(tmp_path):
+    path = tmp_path / "blob.py"
+    path.write_bytes(b"target\x00target\n")
+    pattern, literal = fs_server._compile("target", _SEARCH_FLAGS)
+    assert fs_server._scan_file(str(path), pattern, literal, 10) == []
+
+
+def test_scan_file_skips_oversized_files(monkeypatch, tmp_path):
+    path = tmp_path / "huge.py"
+    path.write_text("target\n" * 10)
+    pattern, literal = fs_server._compile("target", _SEARCH_FLAGS)
+    monkeypatch.setattr(fs_server, "_MAX_SCAN_BYTES", 16)
+    assert fs_server._scan_file(str(path), pattern, literal, 10) == []
+
+
+def test_scan_file_results_do_not_depend_on_file_size(monkeypatch, tmp_path):
+    path = tmp_path / "big.py"
+    filler = "# filler line\n" * 2000
+    path.write_text(filler + "def Target():\n    pass\n" + filler + "x = target  \n")
+    pattern, literal = fs_server._compile(r"target\W", _SEARCH_FLAGS)
+
+    monkeypatch.setattr(fs_server, "_MMAP_MIN_BYTES", 10 ** 9)
+    read_hits = fs_server._scan_file(str(path), pattern, literal, 10)
+    monkeypatch.setattr(fs_server, "_MMAP_MIN_BYTES", 0)
+    mmap_hits = fs_server._scan_file(str(path), pattern, literal, 10)
+
+    assert read_hits == mmap_hits
+    assert [hit.split(":")[1] for hit in read_hits] == ["2001", "4003"]
+
+
+def test_read_file_streams_raw_bytes_only_on_request(monkeypatch, tmp_path):
+    from fastapi.testclient import TestClient
+
+    monkeypatch.setattr(fs_server, "BASE_DIR", None)
+    path = tmp_path / "data.txt"
+    path.write_text("x" * 32)
+    client = TestClient(fs_server.app)
+
+    response = client.post(
+        "/mcp/tools/read_file", json={"path": str(path)},
+        headers={"accept": "application/octet-stream"}
+    )
+    assert response.headers["content-type"] == "application/octet-stream"
+    assert response.content == b"x" * 32
+
+    for accept in ("*/*", "application/json", "application/json, text/plain"):
+        response = client.post(
+            "/mcp/tools/read_file", json={"path": str(path)}, headers={"accept": accept}
+        )
+        assert response.json() == {"content": "x" * 32}
+
+    response = client.post(
+        "/mcp/tools/batch", json={"calls": [{"name": "read_file", "args": {"path": str(path)}}]}
+    )
+    assert response.json() == {"results": [{"content": "x" * 32}]}
+
+
+# ===== git: commit message handling =====
+
+def test_git_commit_message_never_reaches_a_shell(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    for args in (
+        ["init", "-q"],
+        ["config", "user.email", "test@example.com"],
+        ["config", "user.name", "Test"],
+    ):
+        subprocess.run(["git", *args], cwd=repo, check=True)
+    (repo / "file.txt").write_text("content\n")
+    message = 'msg"; touch pwned; echo "$(touch pwned2)`touch pwned3`'
+
+    result = asyncio.run(git_server.git_commit(
+        git_server.ToolRequest(repo_path=str(repo), message=message)
+    ))
+
+    assert result == {"content": f"Committed: {message}"}
+    assert not any((repo / name).exists() for name in ("pwned", "pwned2", "pwned3"))
+    logged = subprocess.run(
+        ["git", "log", "-1", "--format=%s"], cwd=repo, check=True,
+        capture_output=True, text=True
+    ).stdout.strip()
+    assert logged == message
+
+
+# ===== runtime: response parsing =====
+
+@pytest.mark.parametrize("payload", [
+    {"content": "plain text"},
+    {"content": 0.1},
+    {"content": [1, 2.5, {"nested": None}], "extra": True},
+    {"result": "no content field"},
+])
+def test_streamed_content_matches_the_buffered_parse(payload):
+    pytest.importorskip("ijson")
+    raw = json.dumps(payload).encode()
+    parser = agent_runtime._ContentParser()
+    streamed = None
+    for start in range(0, len(raw), 7):
+        streamed = parser.feed(raw[start:start + 7])
+        if streamed is not None:
+            break
+    else:
+        streamed = parser.finish()
+
+    result = agent_runtime._loads(raw)
+    buffered = result.get("content", str(result))
+    assert streamed == buffered
+    assert type(streamed) is type(buffered)
+
+
+# ===== runtime: tool nodes =====
+
+_PATH_SCHEMA = {"type": "object", "properties": {"path": {"type": "string"}}, "required": ["path"]}
+
+
+def _tool_turn(*calls):
+    """Agent state whose last message requests calls in order: (tool name, path) pairs."""
+    return {"messages": [AIMessage(content="", tool_calls=[
+        {"name": name, "args": {"path": path}, "id": f"call_{i}"}
+        for i, (name, path) in enumerate(calls)
+    ])]}
+
+
+@pytest.fixture
+def recording_tools(monkeypatch):
+    """
+    read_file (read-only), write_file and git_commit tools whose calls are recorded.
+
+    Setting barrier makes each read_file call wait on it.
+    """
+    monkeypatch.setattr(agent_runtime, "_RESULT_CACHE", _ResultCache(8, 60.0))
+    log = []
+    sync = {"barrier": None}
+
+    def fake_post(self, kwargs):
+        if self._tool_name == "read_file" and sync["barrier"] is not None:
+            sync["barrier"].wait()
+        elif self._tool_name == "write_file":
+            # A concurrent git_commit would overtake the write here
+            time.sleep(0.05)
+        log.append((self._tool_name, kwargs["path"]))
+        return f"{self._tool_name} {kwargs['path']}"
+
+    async def fake_apost(self, kwargs):
+        if self._tool_name == "write_file":
+            await asyncio.sleep(0.05)
+        log.append((self._tool_name, kwargs["path"]))
+        return f"{self._tool_name} {kwargs['path']}"
+
+    monkeypatch.setattr(MCPTool, "_post", fake_post)
+    monkeypatch.setattr(MCPTool, "_apost", fake_apost)
+    tools = {
+        name: MCPTool("http://local/mcp", name, _PATH_SCHEMA, read_only=(name == "read_file"))
+        for name in ("read_file", "write_file", "git_commit")
+    }
+    return tools, log, sync
+
+
+def test_tool_node_keeps_the_order_of_mutating_calls(recording_tools):
+    tools, log, _ = recording_tools
+    result = agent_runtime.tool_node(
+        _tool_turn(("write_file", "a.py"), ("git_commit", "."), ("read_file", "a.py")), tools
+    )
+    assert log == [("write_file", "a.py"), ("git_commit", "."), ("read_file", "a.py")]
+    assert [m.tool_call_id for m in result["messages"]] == ["call_0", "call_1", "call_2"]
+
+
+def test_tool_node_runs_read_only_calls_concurrently(recording_tools):
+    tools, _, sync = recording_tools
+    # Each read waits for the other, so this only completes if both run at once
+    sync["barrier"] = threading.Barrier(2, timeout=2)
+    result = agent_runtime.tool_node(_tool_turn(("read_file", "a.py"), ("read_file", "b.py")), tools)
+    assert [m.content for m in result["messages"]] == ["read_file a.py", "read_file b.py"]
+
+
+def test_atool_node_keeps_the_order_of_mutating_calls(recording_tools):
+    tools, log, _ = recording_tools
+    result = asyncio.run(agent_runtime.atool_node(
+        _tool_turn(("write_file", "a.py"), ("git_commit", "."), ("read_file", "a.py")), tools
+    ))
+    assert log == [("write_file", "a.py"), ("git_commit", "."), ("read_file", "a.py")]
+    assert [m.tool_call_id for m in result["messages"]] == ["call_0", "call_1", "call_2"]
+
+
+# ===== runtime: result cache =====
+
+def test_result_cache_drops_puts_from_an_older_generation():
+    cache = _ResultCache(maxsize=8, ttl=60)
+    generation = cache.generation
+    cache.invalidate()
+    cache.put(("s", "read", "{}"), "stale", generation)
+    assert cache.get(("s", "read", "{}")) is None
+
+    cache.put(("s", "read", "{}"), "fresh", cache.generation)
+    assert cache.get(("s", "read", "{}")) == "fresh"
+
+
+def test_result_cache_skips_errors_and_evicts_lru():
+    cache = _ResultCache(maxsize=2, ttl=60)
+    cache.put(("k", 0), "Error: boom", cache.generation)
+    cache.put(("k", 1), "HTTP error executing tool: 500", cache.generation)
+    assert cache.get(("k", 0)) is None
+    assert cache.get(("k", 1)) is None
+
+    for i in range(3):
+        cache.put(("k", i), f"v{i}", cache.generation)
+    assert cache.get(("k", 0)) is None
+    assert cache.get(("k", 2)) == "v2"
+
+
+def test_result_cache_expires_entries():
+    cache = _ResultCache(maxsize=8, ttl=-1)
+    cache.put(("k",), "v", cache.generation)
+    assert cache.get(("k",)) is None
+
+
+def test_write_tool_invalidates_reads_on_every_server(monkeypatch):
+    monkeypatch.setattr(agent_runtime, "_RESULT_TTL", 60.0)
+    monkeypatch.setattr(agent_runtime, "_RESULT_CACHE", _ResultCache(8, 60.0))
+    reader = MCPTool("http://fs/mcp", "read_file", _PATH_SCHEMA, read_only=True)
+    writer = MCPTool("http://git/mcp", "git_commit", _PATH_SCHEMA)
+
+    calls = []
+
+    def fake_post(self, kwargs):
+        calls.append(self._tool_name)
+        return f"{self._tool_name} #{len(calls)}"
+
+    monkeypatch.setattr(MCPTool, "_post", fake_post)
+
+    assert reader._run(path="a") == "read_file #1"
+    assert reader._run(path="a") == "read_file #1"
+    writer._run(path="a")
+    assert reader._run(path="a") == "read_file #3"
+    assert calls == ["read_file", "git_commit", "read_file"]
@@ -7,8 +7,16 @@ import sys
 import io
 from pathlib import Path
 from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import itertools
 import json
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from contextlib import nullcontext
 
 # Fix Windows console encoding
@@ -23,18 +31,37 @@ logging.basicConfig(
 )
 logger = logging.getLogger("autonomous_flow")
 
-# Try to use observability if available
+# Tracing is opt-in (AUTONOMOUS_FLOW_TRACING=1): the OpenTelemetry stack is only
+# imported and started when requested, keeping quick commands like `status` fast
+OBSERVABILITY_AVAILABLE = False
+if os.environ.get("AUTONOMOUS_FLOW_TRACING", "0") == "1":
+    try:
+        from universal_agent_nexus.observability import setup_tracing, trace_execution
+        setup_tracing(service_name="autonomous-flow", environment="development")
+        OBSERVABILITY_AVAILABLE = True
+        logger.info("Observability enabled: OpenTelemetry tracing available")
+    except ImportError:
+        logger.warning("Observability module not available - using basic logging")
+
+# Optional: orjson for faster JSON parsing and serialization
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional: h2 lets the status-check client negotiate HTTP/2
 try:
-    from universal_agent_nexus.observability import setup_tracing, trace_execution
-    setup_tracing(service_name="autonomous-flow", environment="development")
-    OBSERVABILITY_AVAILABLE = True
-    logger.info("Observability enabled: OpenTelemetry tracing available")
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
 except ImportError:
-    OBSERVABILITY_AVAILABLE = False
-    logger.warning("Observability module not available - using basic logging")
+    HTTP2_AVAILABLE = False
 
-# Add parent for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "08-local-agent-runtime" / "runtime"))
+# Add the 08 runtime for imports: appended once (agent_runtime has no competing
+# module), so stdlib and site-packages lookups don't scan it first
+_RUNTIME_PATH = str(Path(__file__).parent.parent / "08-local-agent-runtime" / "runtime")
+if _RUNTIME_PATH not in sys.path:
+    sys.path.append(_RUNTIME_PATH)
 
 from langgraph.graph import StateGraph, END
 from typing import TypedDict, Annotated, Sequence
@@ -61,61 +88,366 @@ class AgentState(TypedDict):
     messages: Annotated[Sequence[BaseMessage], operator.add]
 
 
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _as_text(value) -> str:
+    """str() only when needed: message contents and MCP results are usually str already."""
+    return value if isinstance(value, str) else str(value)
+
+
+def _dumps(obj, sort_keys: bool = False) -> bytes:
+    """Compact UTF-8 JSON (orjson when available; both paths produce the same bytes)."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS if sort_keys else 0)
+    return json.dumps(
+        obj, default=str, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def _loads(data):
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+# Repeating a call in a later turn must not reuse an earlier call's ID
+_CALL_SEQ = itertools.count()
+
+
+def _tool_call_id(obj: dict) -> str:
+    """Content hash of the call plus a per-run sequence number, unique within the run."""
+    digest = hashlib.blake2b(
+        _dumps(obj, sort_keys=True), digest_size=8
+    ).hexdigest()
+    return f"call_{obj['name']}_{digest}_{next(_CALL_SEQ)}"
+
+
+def _as_tool_call(obj) -> list:
+    if isinstance(obj, dict) and "name" in obj:
+        return [{
+            "name": obj["name"],
+            "args": obj.get("arguments", {}),
+            "id": _tool_call_id(obj)
+        }]
+    return []
+
+
 def parse_tool_calls_from_content(content: str, tools: list) -> list:
     """Parse tool calls from JSON content."""
-    import re
-    
     if not content or not isinstance(content, str):
         return []
     
+    # Plain prose: no JSON object to find
+    if "{" not in content:
+        return []
+    
+    stripped = content.strip()
     try:
-        tool_call = json.loads(content.strip())
-        if isinstance(tool_call, dict) and "name" in tool_call:
-            return [{
-                "name": tool_call["name"],
-                "args": tool_call.get("arguments", {}),
-                "id": f"call_{tool_call['name']}_{hash(str(tool_call))}"
-            }]
+        if ORJSON_AVAILABLE:
+            try:
+                tool_call = orjson.loads(stripped)
+            except orjson.JSONDecodeError:
+                # raw_decode tolerates trailing text after the JSON object
+                tool_call, _ = _JSON_DECODER.raw_decode(stripped)
+        else:
+            tool_call, _ = _JSON_DECODER.raw_decode(stripped)
+        parsed = _as_tool_call(tool_call)
+        if parsed:
+            return parsed
     except json.JSONDecodeError:
         pass
     
-    # Try to find JSON in content
-    json_match = re.search(r'\{[^{}]*"name"[^{}]*\}', content)
-    if json_match:
+    # Try to find JSON in content: decode from each opening brace, which handles
+    # nested arguments wherever the "name" key appears in the object
+    start = content.find("{")
+    while start != -1:
         try:
-            tool_call = json.loads(json_match.group(0))
-            if "name" in tool_call:
-                return [{
-                    "name": tool_call["name"],
-                    "args": tool_call.get("arguments", {}),
-                    "id": f"call_{tool_call['name']}_{hash(str(tool_call))}"
-                }]
+            tool_call, _ = _JSON_DECODER.raw_decode(content, start)
         except json.JSONDecodeError:
             pass
+        else:
+            parsed = _as_tool_call(tool_call)
+            if parsed:
+                return parsed
+        start = content.find("{", start + 1)
     
     return []
 
 
+# MCP tool calls are network-bound; the pool is created on first multi-tool turn
+_TOOL_POOL = None
+_TOOL_POOL_WORKERS = 8
+
+
+def _get_tool_pool() -> ThreadPoolExecutor:
+    global _TOOL_POOL
+    if _TOOL_POOL is None:
+        _TOOL_POOL = ThreadPoolExecutor(max_workers=_TOOL_POOL_WORKERS, thread_name_prefix="mcp-tool")
+    return _TOOL_POOL
+
+
+# Results of read-only tools, reused across turns and agents in this process
+_CACHEABLE_TOOL_PREFIXES = ("get_", "analyze_", "list_")
+_TOOL_CACHE_TTL = 300.0
+_TOOL_CACHE_SIZE = 128
+
+
+class _ToolResultCache:
+    """
+    Thread-safe TTL LRU of (tool name, args hash) -> result, with hit/miss counters.
+    
+    A read that started before a write cleared the cache cannot store its
+    result afterwards: put() only accepts results from the current generation.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+    
+    @staticmethod
+    def key(tool_name: str, tool_args: dict) -> tuple:
+        args = _dumps(tool_args, sort_keys=True)
+        return (tool_name, hashlib.blake2b(args, digest_size=16).hexdigest())
+    
+    def get(self, key: tuple):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[1] <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+    
+    def put(self, key: tuple, result, generation: int) -> None:
+        with self._lock:
+            if generation != self.generation:
+                return
+            self._entries[key] = (result, time.monotonic())
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+
+_TOOL_CACHE = _ToolResultCache(_TOOL_CACHE_SIZE, _TOOL_CACHE_TTL)
+
+
+def _execute_tool_call(tc: dict, tools_by_name: dict, events: list) -> ToolMessage:
+    """
+    Run one tool call; failures become error ToolMessages so sibling calls are unaffected.
+    
+    The outcome is appended to events (logged once per turn by _log_tool_turn);
+    warnings and errors are still logged immediately.
+    """
+    tool_name = tc["name"]
+    tool_args = tc.get("args", {})
+    tool_id = tc.get("id", tool_name)
+    event = {
+        "tool_name": tool_name,
+        "tool_id": tool_id,
+        "args_keys": list(tool_args.keys()) if tool_args else []
+    }
+    events.append(event)
+    
+    tool = tools_by_name.get(tool_name)
+    if not tool:
+        event["status"] = "not_found"
+        logger.warning("Tool not found", extra={"tool_name": tool_name})
+        return ToolMessage(content=f"Tool {tool_name} not found", tool_call_id=tool_id)
+    
+    cache_key = None
+    if tool_name.startswith(_CACHEABLE_TOOL_PREFIXES):
+        cache_key = _TOOL_CACHE.key(tool_name, tool_args)
+        generation = _TOOL_CACHE.generation
+        cached = _TOOL_CACHE.get(cache_key)
+        if cached is not None:
+            event["status"] = "cached"
+            return ToolMessage(content=cached, tool_call_id=tool_id)
+    else:
+        # Writes (bulk_sync_all, write_section, ...) may change what the reads return
+        _TOOL_CACHE.clear()
+    
+    try:
+        # Stringified once; large payloads (analyze_full_stack) are not re-copied below
+        result = _as_text(tool._run(**tool_args))
+        event["status"] = "ok"
+        event["result_length"] = len(result)
+        logger.debug("Tool result: %.500s", result)
+        # MCPTool reports failures as strings; only cache real results
+        if cache_key is not None and not result.startswith(("HTTP error", "Error")):
+            _TOOL_CACHE.put(cache_key, result, generation)
+    except Exception as e:
+        event["status"] = "error"
+        logger.error("Tool execution failed", extra={
+            "tool_name": tool_name,
+            "error": str(e)
+        }, exc_info=True)
+        result = f"Error: {str(e)}"
+    
+    return ToolMessage(content=result, tool_call_id=tool_id)
+
+
+def _log_tool_turn(events: list) -> None:
+    """One structured record per tools-node turn instead of two per tool call."""
+    if events and logger.isEnabledFor(logging.INFO):
+        logger.info("Tool turn complete", extra={"events": events, "count": len(events)})
+
+
+# Recent messages sent to the LLM besides the pinned prefix (AUTONOMOUS_FLOW_HISTORY=0 sends everything)
+_HISTORY_WINDOW = int(os.environ.get("AUTONOMOUS_FLOW_HISTORY", "12"))
+
+
+def _pinned_prefix_end(messages: Sequence[BaseMessage]) -> int:
+    """Index just past the first tool exchange (or the task prompt if there is none)."""
+    for i, msg in enumerate(messages):
+        if isinstance(msg, ToolMessage):
+            end = i + 1
+            while end < len(messages) and isinstance(messages[end], ToolMessage):
+                end += 1
+            return end
+    return 1
+
+
+def _window_messages(messages: Sequence[BaseMessage]) -> Sequence[BaseMessage]:
+    """
+    Keep the task prompt and first tool exchange plus the most recent messages.
+    
+    Prompt-eval cost grows with every tool turn otherwise. The first tool
+    result (analyze_full_stack in the query and document flows) is pinned
+    because later turns are written from it. ToolMessages at the start of
+    the window are dropped so no result is sent without the AIMessage that
+    requested it.
+    """
+    if not _HISTORY_WINDOW:
+        return messages
+    head_end = _pinned_prefix_end(messages)
+    start = len(messages) - _HISTORY_WINDOW
+    if start <= head_end:
+        return messages
+    while start < len(messages) and isinstance(messages[start], ToolMessage):
+        start += 1
+    return [*messages[:head_end], *messages[start:]]
+
+
+def _all_read_only(tool_calls: list) -> bool:
+    """True if every call is to a read-only tool (same prefixes as the result cache)."""
+    return all(tc.get("name", "").startswith(_CACHEABLE_TOOL_PREFIXES) for tc in tool_calls)
+
+
+def _execute_tool_calls_concurrently(tool_calls: list, tools_by_name: dict, events: list) -> list:
+    """
+    Run tool calls on the pool, returning ToolMessages in tool_call order.
+    
+    Results are placed in indexed slots as they complete; a call that raises
+    gets an error ToolMessage in its own slot instead of failing the turn.
+    """
+    results = [None] * len(tool_calls)
+    pool = _get_tool_pool()
+    future_to_idx = {
+        pool.submit(_execute_tool_call, tc, tools_by_name, events): i
+        for i, tc in enumerate(tool_calls)
+    }
+    for future in as_completed(future_to_idx):
+        i = future_to_idx[future]
+        try:
+            results[i] = future.result()
+        except Exception as e:
+            tc = tool_calls[i]
+            logger.error("Tool call failed", extra={"tool_name": tc.get("name"), "error": str(e)})
+            results[i] = ToolMessage(
+                content=f"Error: {str(e)}",
+                tool_call_id=tc.get("id") or tc.get("name", "unknown")
+            )
+    return results
+
+
+def _run_tool_calls(tool_calls: list, tools_by_name: dict) -> list:
+    """
+    Run one turn's tool calls, returning ToolMessages in tool_call order.
+    
+    Only all-read turns run concurrently: writes (create_document_plan,
+    write_section, compile_document, bulk_sync_*) share state and must run
+    in the order the agent requested them.
+    """
+    events = []
+    if len(tool_calls) > 1 and _all_read_only(tool_calls):
+        tool_messages = _execute_tool_calls_concurrently(tool_calls, tools_by_name, events)
+    else:
+        tool_messages = [_execute_tool_call(tc, tools_by_name, events) for tc in tool_calls]
+    _log_tool_turn(events)
+    return tool_messages
+
+
+# server_url -> tools, and (server_url, model) -> tool-bound LLM, for this process
+_TOOLS_BY_SERVER: dict = {}
+_LLMS: dict = {}
+
+
+def _load_tools(server_url: str) -> list:
+    """Discover a server's tools once per process (failed or empty loads are retried)."""
+    tools = _TOOLS_BY_SERVER.get(server_url)
+    if tools is None:
+        tools = MCPToolLoader.load_from_server(server_url)
+        if tools:
+            _TOOLS_BY_SERVER[server_url] = tools
+    return tools
+
+
+def _build_llm(server_url: str, model: str):
+    """LLM bound to a server's tools, built once per (server, model)."""
+    key = (server_url, model)
+    llm = _LLMS.get(key)
+    if llm is None:
+        tools = _load_tools(server_url)
+        llm, _ = create_llm_with_tools(tools, model=model)
+        if tools:
+            _LLMS[key] = llm
+    return llm
+
+
+# task_type -> (compiled graph, tools), built on first use
+_AGENTS: dict = {}
+
+
 def create_agent(task_type: str = "sync"):
     """
     Create the agent for a specific task type.
     
     task_type: "sync", "query", or "maintain"
+    
+    The compiled graph is reused for later calls with the same task type.
     """
+    cached = _AGENTS.get(task_type)
+    if cached is not None:
+        return cached
+    
     logger.info(f"Creating {task_type} agent", extra={"task_type": task_type})
     
-    # Load tools from our MCP server
-    tools = MCPToolLoader.load_from_server(MCP_SERVER)
+    # Load tools from our MCP server (reused across create_agent calls)
+    tools = _load_tools(MCP_SERVER)
     logger.info(f"Loaded {len(tools)} tools", extra={"tool_count": len(tools), "server": MCP_SERVER})
     
     # Create LLM
-    llm, _ = create_llm_with_tools(tools, model="qwen3")
+    llm = _build_llm(MCP_SERVER, "qwen3")
     logger.info("LLM ready", extra={"model": "qwen3"})
     
+    tools_by_name = {t.name: t for t in tools}
+    
     # Build graph
     def agent_node(state: AgentState):
         """Agent decides what to do."""
-        messages = state["messages"]
+        messages = _window_messages(state["messages"])
         response = llm.invoke(messages)
         
         # Parse tool calls from content if needed
@@ -136,49 +468,19 @@ def create_agent(task_type: str = "sync"):
                 response = AIMessage(content=response.content, tool_calls=parsed)
             else:
                 logger.info("Agent generated text response (no tool calls)", extra={
-                    "content_length": len(str(response.content))
+                    "content_length": len(_as_text(response.content))
                 })
         
         return {"messages": [response]}
     
     def tool_node(state: AgentState):
-        """Execute tool calls."""
+        """Execute tool calls (concurrently when the agent requested several reads)."""
         last_message = state["messages"][-1]
-        tool_messages = []
         
-        if hasattr(last_message, "tool_calls") and last_message.tool_calls:
-            for tc in last_message.tool_calls:
-                tool_name = tc["name"]
-                tool_args = tc.get("args", {})
-                tool_id = tc.get("id", tool_name)
-                
-                logger.info("Executing tool", extra={
-                    "tool_name": tool_name,
-                    "tool_id": tool_id,
-                    "args_keys": list(tool_args.keys()) if tool_args else []
-                })
-                
-                tool = next((t for t in tools if t.name == tool_name), None)
-                if tool:
-                    try:
-                        result = tool._run(**tool_args)
-                        logger.info("Tool executed successfully", extra={
-                            "tool_name": tool_name,
-                            "result_length": len(str(result))
-                        })
-                    except Exception as e:
-                        logger.error("Tool execution failed", extra={
-                            "tool_name": tool_name,
-                            "error": str(e)
-                        }, exc_info=True)
-                        result = f"Error: {str(e)}"
-                    
-                    tool_messages.append(ToolMessage(content=str(result), tool_call_id=tool_id))
-                else:
-                    logger.warning("Tool not found", extra={"tool_name": tool_name})
-                    tool_messages.append(ToolMessage(content=f"Tool {tool_name} not found", tool_call_id=tool_id))
+        if not (hasattr(last_message, "tool_calls") and last_message.tool_calls):
+            return {"messages": []}
         
-        return {"messages": tool_messages}
+        return {"messages": _run_tool_calls(last_message.tool_calls, tools_by_name)}
     
     def should_continue(state: AgentState):
         """Decide if we should continue."""
@@ -195,7 +497,31 @@ def create_agent(task_type: str = "sync"):
     graph.add_conditional_edges("agent", should_continue, {"tools": "tools", "end": END})
     graph.add_edge("tools", "agent")
     
-    return graph.compile(), tools
+    agent = graph.compile()
+    if tools:
+        _AGENTS[task_type] = (agent, tools)
+    return agent, tools
+
+
+def _write_lines(lines: list) -> None:
+    """Write a step's output lines with one write/flush instead of a print per line."""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def _stream_messages(agent, inputs: dict, config: dict):
+    """
+    Yield (node, newest message) for each graph step.
+    
+    Uses stream_mode="updates", which emits only the messages a node added
+    instead of replaying the whole accumulated history on every step.
+    """
+    for event in agent.stream(inputs, config, stream_mode="updates"):
+        for node, update in event.items():
+            messages = (update or {}).get("messages")
+            if messages:
+                yield node, messages[-1]
 
 
 def run_sync_agent():
@@ -226,27 +552,26 @@ Start now."""
     step = 0
     max_steps = 10  # Should complete in ~3-4 steps now
     
-    for event in agent.stream(
+    for node, last in _stream_messages(
+        agent,
         {"messages": [HumanMessage(content=prompt)]},
         {"recursion_limit": 50},
-        stream_mode="values"
     ):
         step += 1
-        messages = event.get("messages", [])
+        out = []  # this step's output, written in one call
+        
+        if hasattr(last, 'tool_calls') and last.tool_calls:
+            for tc in last.tool_calls:
+                out.append(f"\n[TOOL] [{step}] Tool: {tc.get('name')}")
+                args = tc.get('args', {})
+                if args and str(args) != "{}":
+                    out.append(f"     Args: {_dumps(args).decode()[:100]}")
+        elif hasattr(last, 'content') and last.content:
+            content = _as_text(last.content)
+            if not content.startswith('{'):
+                out.append(f"\n[MSG] [{step}] Agent: {content[:300]}...")
         
-        if messages:
-            last = messages[-1]
-            
-            if hasattr(last, 'tool_calls') and last.tool_calls:
-                for tc in last.tool_calls:
-                    print(f"\n[TOOL] [{step}] Tool: {tc.get('name')}")
-                    args = tc.get('args', {})
-                    if args and str(args) != "{}":
-                        print(f"     Args: {json.dumps(args, default=str)[:100]}")
-            elif hasattr(last, 'content') and last.content:
-                content = str(last.content)
-                if not content.startswith('{'):
-                    print(f"\n[MSG] [{step}] Agent: {content[:300]}...")
+        _write_lines(out)
         
         if step >= max_steps:
             print(f"\n[STOP] Max steps reached ({max_steps})")
@@ -281,29 +606,29 @@ Call analyze_full_stack now."""
     max_steps = 25  # Allow more steps for research
     final_answer = None
     
-    for event in agent.stream(
+    for node, last in _stream_messages(
+        agent,
         {"messages": [HumanMessage(content=prompt)]},
         {"recursion_limit": 60},
-        stream_mode="values"
     ):
         step += 1
-        messages = event.get("messages", [])
+        out = []  # this step's output, written in one call
+        msg_type = type(last).__name__
+        
+        if hasattr(last, 'tool_calls') and last.tool_calls:
+            for tc in last.tool_calls:
+                out.append(f"[TOOL] [{step}] {tc.get('name')}: {str(tc.get('args', {}))[:60]}...")
+        elif msg_type == "ToolMessage":
+            content = _as_text(last.content)[:200]
+            out.append(f"[RESULT] [{step}] Tool result: {content}...")
+        elif node == "agent" and last.content:
+            # Agent reply without tool calls: the answer
+            content = _as_text(last.content)
+            if not content.startswith('{') and len(content) > 100:
+                final_answer = content
+                out.append(f"\n[MSG] [{step}] Response received ({len(content)} chars)")
         
-        if messages:
-            last = messages[-1]
-            msg_type = type(last).__name__
-            
-            if hasattr(last, 'tool_calls') and last.tool_calls:
-                for tc in last.tool_calls:
-                    print(f"[TOOL] [{step}] {tc.get('name')}: {str(tc.get('args', {}))[:60]}...")
-            elif msg_type == "ToolMessage":
-                content = str(last.content)[:200]
-                print(f"[RESULT] [{step}] Tool result: {content}...")
-            elif hasattr(last, 'content') and last.content:
-                content = str(last.content)
-                if not content.startswith('{') and len(content) > 100:
-                    final_answer = content
-                    print(f"\n[MSG] [{step}] Response received ({len(content)} chars)")
+        _write_lines(out)
         
         if step >= max_steps:
             print(f"\n[STOP] Max steps reached")
@@ -383,83 +708,83 @@ Start with PHASE 1: call analyze_full_stack now."""
     max_steps = 15  # Quick test: 1 research + 1 plan + 3 sections + 1 compile = ~6 steps, allow 2x for safety
     current_phase = "PREPROCESSING"
     
-    for event in agent.stream(
+    for node, last in _stream_messages(
+        agent,
         {"messages": [HumanMessage(content=prompt)]},
         {"recursion_limit": 80},
-        stream_mode="values"
     ):
         step += 1
-        messages = event.get("messages", [])
+        out = []  # this step's output, written in one call
+        
+        if hasattr(last, 'tool_calls') and last.tool_calls:
+            for tc in last.tool_calls:
+                tool_name = tc.get('name')
+                
+                # Track phase
+                if tool_name == "analyze_codebase_structure":
+                    current_phase = "PREPROCESSING"
+                elif tool_name == "create_semantic_clusters":
+                    current_phase = "PREPROCESSING"
+                elif tool_name == "build_dependency_graph":
+                    current_phase = "PREPROCESSING"
+                elif tool_name == "calculate_pagerank_scores":
+                    current_phase = "PREPROCESSING"
+                elif tool_name == "create_multi_pass_plan" or tool_name == "create_document_plan":
+                    current_phase = "PLANNING"
+                elif tool_name == "set_preprocessing_data":
+                    current_phase = "STORING_DATA"
+                elif tool_name == "write_section":
+                    current_phase = "WRITING"
+                elif tool_name == "compile_document":
+                    current_phase = "COMPILING"
+                
+                args = tc.get('args', {})
+                arg_preview = ""
+                if 'section_id' in args:
+                    arg_preview = f"({args['section_id']})"
+                elif 'title' in args:
+                    arg_preview = f"({args['title'][:40]}...)"
+                elif 'filename' in args:
+                    arg_preview = f"({args['filename']})"
+                
+                out.append(f"[PHASE] [{current_phase}] {tool_name} {arg_preview}")
+        
+        elif isinstance(last, ToolMessage):
+            content = _as_text(last.content)
+            # Show tool response (truncated)
+            out.append(f"[RESULT] [{step}] Tool response: {content[:200]}...")
+            # Check for document saved message
+            if "document_saved" in content:
+                try:
+                    result = _loads(content)
+                    if result.get("status") == "document_saved":
+                        out.append(f"\n[OK] Document saved: {result.get('path')}")
+                        out.append(f"   Sections: {result.get('sections_compiled')}")
+                        out.append(f"   Size: {result.get('total_chars')} chars")
+                        _write_lines(out)
+                        break
+                except:
+                    pass
+            # Check for plan created
+            elif "plan_created" in content:
+                out.append(f"   [PLAN] Plan created successfully")
+            # Check for section written
+            elif "section_written" in content or "all_sections_complete" in content:
+                try:
+                    result = _loads(content)
+                    completed = result.get("completed", 0)
+                    total = result.get("total", 0)
+                    out.append(f"   [WRITE] Progress: {completed}/{total} sections")
+                except:
+                    pass
+        
+        elif hasattr(last, 'content') and last.content and not hasattr(last, 'tool_calls'):
+            # Agent generated text response without tool calls - might be stopping
+            content = _as_text(last.content)
+            if len(content) > 50:
+                out.append(f"[MSG] [{step}] Agent text (no tools): {content[:200]}...")
         
-        if messages:
-            last = messages[-1]
-            
-            if hasattr(last, 'tool_calls') and last.tool_calls:
-                for tc in last.tool_calls:
-                    tool_name = tc.get('name')
-                    
-                    # Track phase
-                    if tool_name == "analyze_codebase_structure":
-                        current_phase = "PREPROCESSING"
-                    elif tool_name == "create_semantic_clusters":
-                        current_phase = "PREPROCESSING"
-                    elif tool_name == "build_dependency_graph":
-                        current_phase = "PREPROCESSING"
-                    elif tool_name == "calculate_pagerank_scores":
-                        current_phase = "PREPROCESSING"
-                    elif tool_name == "create_multi_pass_plan" or tool_name == "create_document_plan":
-                        current_phase = "PLANNING"
-                    elif tool_name == "set_preprocessing_data":
-                        current_phase = "STORING_DATA"
-                    elif tool_name == "write_section":
-                        current_phase = "WRITING"
-                    elif tool_name == "compile_document":
-                        current_phase = "COMPILING"
-                    
-                    args = tc.get('args', {})
-                    arg_preview = ""
-                    if 'section_id' in args:
-                        arg_preview = f"({args['section_id']})"
-                    elif 'title' in args:
-                        arg_preview = f"({args['title'][:40]}...)"
-                    elif 'filename' in args:
-                        arg_preview = f"({args['filename']})"
-                    
-                    print(f"[PHASE] [{current_phase}] {tool_name} {arg_preview}")
-            
-            elif isinstance(last, ToolMessage):
-                content = str(last.content)
-                # Show tool response (truncated)
-                print(f"[RESULT] [{step}] Tool response: {content[:200]}...")
-                # Check for document saved message
-                if "document_saved" in content:
-                    try:
-                        result = json.loads(content)
-                        if result.get("status") == "document_saved":
-                            print(f"\n[OK] Document saved: {result.get('path')}")
-                            print(f"   Sections: {result.get('sections_compiled')}")
-                            print(f"   Size: {result.get('total_chars')} chars")
-                            break
-                    except:
-                        pass
-                # Check for plan created
-                elif "plan_created" in content:
-                    print(f"   [PLAN] Plan created successfully")
-                # Check for section written
-                elif "section_written" in content or "all_sections_complete" in content:
-                    try:
-                        result = json.loads(content)
-                        completed = result.get("completed", 0)
-                        total = result.get("total", 0)
-                        print(f"   [WRITE] Progress: {completed}/{total} sections")
-                    except:
-                        pass
-            
-            elif hasattr(last, 'content') and last.content and not hasattr(last, 'tool_calls'):
-                # Agent generated text response without tool calls - might be stopping
-                content = str(last.content)
-                if len(content) > 50:
-                    print(f"[MSG] [{step}] Agent text (no tools): {content[:200]}...")
+        _write_lines(out)
         
         if step >= max_steps:
             logger.warning(f"Max steps reached ({max_steps}) - stopping to prevent infinite loop", extra={
@@ -481,10 +806,20 @@ def run_status_check():
     
     import httpx
     
+    async def _fetch_status():
+        # Both probes are independent reads: issue them concurrently on one
+        # keep-alive client (multiplexed when the server speaks HTTP/2)
+        async with httpx.AsyncClient(base_url=MCP_SERVER, timeout=10, http2=HTTP2_AVAILABLE) as client:
+            return await asyncio.gather(
+                client.post("/tools/get_sync_status", json={}),
+                client.post("/tools/get_storage_stats", json={}),
+            )
+    
     try:
+        status_response, stats_response = asyncio.run(_fetch_status())
+        
         # Get sync status
-        r = httpx.post(f"{MCP_SERVER}/tools/get_sync_status", json={}, timeout=10)
-        status = json.loads(r.json().get("content", "{}"))
+        status = _loads(_loads(status_response.content).get("content", "{}"))
         
         print("\n[SYNC] Sync Status:")
         if "repos" in status:
@@ -494,8 +829,7 @@ def run_status_check():
             print(f"   {status}")
         
         # Get storage stats
-        r = httpx.post(f"{MCP_SERVER}/tools/get_storage_stats", json={}, timeout=10)
-        stats = json.loads(r.json().get("content", "{}"))
+        stats = _loads(_loads(stats_response.content).get("content", "{}"))
         
         print(f"\n[STORE] Storage Stats:")
         print(f"   Repos tracked: {stats.get('repos_tracked', 0)}")
@@ -537,6 +871,12 @@ def main():
             print("Error: --topic is required for document command")
             return
         run_document_agent(args.topic, args.output)
+    
+    if _TOOL_CACHE.hits or _TOOL_CACHE.misses:
+        logger.info("Tool result cache", extra={
+            "hits": _TOOL_CACHE.hits,
+            "misses": _TOOL_CACHE.misses
+        })
 
 
 if __name__ == "__main__":
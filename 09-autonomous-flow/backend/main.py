@@ -14,6 +14,12 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from universal_agent_nexus.runtime import get_registry
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+
 
 def discover_and_regenerate():
     """
@@ -47,7 +53,7 @@ def discover_and_regenerate():
     print("\n4. Loading base manifest...")
     manifest_path = Path(__file__).parent.parent / "autonomous_flow.yaml"
     with open(manifest_path, 'r') as f:
-        manifest = yaml.safe_load(f)
+        manifest = yaml.load(f, Loader=YamlLoader)
     
     # 5. Regenerate manifest with discovered tools
     print("\n5. Regenerating manifest with discovered tools...")
@@ -69,7 +75,7 @@ def discover_and_regenerate():
     # 6. Save regenerated manifest
     regenerated_path = Path(__file__).parent.parent / "autonomous_flow_regenerated.yaml"
     with open(regenerated_path, 'w') as f:
-        yaml.dump(manifest, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(manifest, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False)
     print(f"   ✅ Saved regenerated manifest to {regenerated_path.name}")
     
     # 7. Next step: Compile regenerated manifest
@@ -12,6 +12,7 @@ Code Reduction:
 - After: ~238 LOC (-30%)
 """
 
+import argparse
 import asyncio
 import sys
 from pathlib import Path
@@ -19,6 +20,8 @@ from typing import Dict, Any, List
 from datetime import datetime
 
 from pydantic import BaseModel, Field
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import get_llm_cache, set_llm_cache
 from langchain_ollama import ChatOllama
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -30,6 +33,7 @@ from shared.workflows.common_nodes import (
     ValidationNode,
 )
 from shared.workflows.workflow import Workflow
+from shared.workflows.batching import MicroBatcher
 
 
 class AutonomousState(NodeState):
@@ -118,6 +122,12 @@ class AutonomousWorkflow(Workflow):
                 ("execution_simulator", "reflection_validator"),
             ],
         )
+        
+        # Stage order resolved once (nodes is keyed by name)
+        self._pipeline = [
+            self.nodes[name]
+            for name in ("plan_generator", "execution_simulator", "reflection_validator")
+        ]
     
     async def invoke(self, objective: str, max_iterations: int = 1) -> Dict[str, Any]:
         """Run autonomous cycle with optional iteration."""
@@ -129,23 +139,9 @@ class AutonomousWorkflow(Workflow):
             # Execute cycle
             state = {"objective": current_objective}
             
-            # Plan
-            for node in self.nodes.values():
-                if node.name == "plan_generator":
-                    state = await node.execute(state)
-                    break
-            
-            # Execute
-            for node in self.nodes.values():
-                if node.name == "execution_simulator":
-                    state = await node.execute(state)
-                    break
-            
-            # Reflect
-            for node in self.nodes.values():
-                if node.name == "reflection_validator":
-                    state = await node.execute(state)
-                    break
+            # Plan -> Execute -> Reflect
+            for node in self._pipeline:
+                state = await node.execute(state)
             
             exec_result = state.get("execution_result", {})
             results.append({
@@ -162,7 +158,53 @@ class AutonomousWorkflow(Workflow):
                     current_objective = next_actions[0]
         
         duration = (datetime.now() - start).total_seconds() * 1000
+        return self._summarize(objective, results, duration)
+    
+    async def invoke_batch(
+        self, objectives: List[str], max_concurrency: int = 4
+    ) -> List[Any]:
+        """
+        Run one Plan-Execute-Reflect cycle for several objectives, stage by stage.
+        
+        Each stage is sent for all objectives at once (up to max_concurrency
+        in flight), so Ollama receives same-model prompts together and can
+        serve them in parallel. Objectives that fail are returned as their
+        exception and skip later stages; the others continue.
+        """
+        start = datetime.now()
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def run_stage(node, state):
+            async with semaphore:
+                return await node.execute(state)
         
+        outcomes: List[Any] = [{"objective": objective} for objective in objectives]
+        for node in self._pipeline:
+            live = [i for i, o in enumerate(outcomes) if not isinstance(o, Exception)]
+            stage_results = await asyncio.gather(
+                *(run_stage(node, outcomes[i]) for i in live),
+                return_exceptions=True,
+            )
+            for i, result in zip(live, stage_results):
+                outcomes[i] = result
+        
+        duration = (datetime.now() - start).total_seconds() * 1000
+        summaries: List[Any] = []
+        for objective, outcome in zip(objectives, outcomes):
+            if isinstance(outcome, Exception):
+                summaries.append(outcome)
+                continue
+            exec_result = outcome.get("execution_result", {})
+            summaries.append(self._summarize(objective, [{
+                "iteration": 1,
+                "completed": len(exec_result.get("completed_steps", [])),
+                "success_rate": exec_result.get("success_rate", 0.0),
+                "issues": len(exec_result.get("issues_encountered", [])),
+            }], duration))
+        return summaries
+    
+    @staticmethod
+    def _summarize(objective: str, results: List[Dict[str, Any]], duration: float) -> Dict[str, Any]:
         return {
             "objective": objective[:60] + "..." if len(objective) > 60 else objective,
             "iterations": len(results),
@@ -172,7 +214,50 @@ class AutonomousWorkflow(Workflow):
         }
 
 
+class BatchingWorkflowRunner(MicroBatcher):
+    """
+    Coalesce concurrent invoke() callers into AutonomousWorkflow.invoke_batch calls.
+    
+    For serving the workflow behind an API: objectives submitted within a
+    short window run together, stage by stage, instead of each caller
+    driving its own cycle.
+    
+    Example:
+        runner = BatchingWorkflowRunner(workflow)
+        results = await asyncio.gather(*(runner.invoke(o) for o in objectives))
+        await runner.aclose()
+    """
+    
+    def __init__(self, workflow: AutonomousWorkflow, max_batch_size: int = 32, batch_wait_ms: float = 20.0):
+        super().__init__(max_batch_size=max_batch_size, max_wait_ms=batch_wait_ms)
+        self.workflow = workflow
+    
+    async def invoke(self, objective: str) -> Dict[str, Any]:
+        return await self.submit(objective)
+    
+    async def _run_batch(self, objectives: list) -> list:
+        return await self.workflow.invoke_batch(objectives, max_concurrency=self.max_batch_size)
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Autonomous Flow - Plan-Execute-Reflect")
+    parser.add_argument("--sequential", action="store_true",
+                        help="Run objectives one at a time instead of concurrently")
+    parser.add_argument("--concurrency", type=int, default=4,
+                        help="Maximum objectives per batch (default: 4)")
+    parser.add_argument("--batch-wait-ms", type=float, default=20.0,
+                        help="How long a batch waits for more objectives (default: 20)")
+    return parser.parse_args(argv)
+
+
 async def main():
+    args = parse_args()
+    
+    # Identical (model, params, prompt) calls are answered from memory instead of
+    # re-hitting Ollama; the creative planner opts out below (cache=False)
+    if get_llm_cache() is None:
+        set_llm_cache(InMemoryCache())
+    
     print("\n" + "="*70)
     print("Example 09: Autonomous Flow - December 2025 Orchestration")
     print("="*70 + "\n")
@@ -182,6 +267,7 @@ async def main():
         model="qwen3:8b",
         base_url="http://localhost:11434",
         temperature=0.8,  # Creative reasoning
+        cache=False,  # Sampling at 0.8: reusing a plan would defeat exploration
         # num_predict removed - using model default prevents empty responses
     )
     llm_extraction = ChatOllama(
@@ -200,16 +286,37 @@ async def main():
     
     print(f"Running {len(objectives)} autonomous workflows...\n")
     
-    for i, objective in enumerate(objectives, 1):
+    if args.sequential:
+        results = []
+        for objective in objectives:
+            try:
+                results.append(await workflow.invoke(objective, max_iterations=1))
+            except Exception as e:
+                results.append(e)
+    else:
+        # Objectives are independent and LLM-bound: concurrent callers are batched
+        # and each stage is sent for the whole batch, capped by --concurrency so
+        # the Ollama server isn't flooded
+        runner = BatchingWorkflowRunner(
+            workflow, max_batch_size=args.concurrency, batch_wait_ms=args.batch_wait_ms
+        )
         try:
-            result = await workflow.invoke(objective, max_iterations=1)
-            print(f"[{i}] Objective: {result['objective']}")
-            print(f"    Iterations: {result['iterations']}")
-            print(f"    Final Success: {result['final_success_rate']:.1%}")
-            print(f"    Issues Found: {result['total_issues']}")
-            print(f"    Duration: {result['metrics']['duration_ms']:.0f}ms\n")
-        except Exception as e:
-            print(f"[{i}] Error: {e}\n")
+            results = await asyncio.gather(
+                *(runner.invoke(objective) for objective in objectives),
+                return_exceptions=True,
+            )
+        finally:
+            await runner.aclose()
+    
+    for i, result in enumerate(results, 1):
+        if isinstance(result, Exception):
+            print(f"[{i}] Error: {result}\n")
+            continue
+        print(f"[{i}] Objective: {result['objective']}")
+        print(f"    Iterations: {result['iterations']}")
+        print(f"    Final Success: {result['final_success_rate']:.1%}")
+        print(f"    Issues Found: {result['total_issues']}")
+        print(f"    Duration: {result['metrics']['duration_ms']:.0f}ms\n")
     
     print("="*70 + "\n")
 
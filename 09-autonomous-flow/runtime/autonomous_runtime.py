@@ -6,6 +6,7 @@ This runtime loads the regenerated manifest and executes it using
 LangGraph with MCP tools and Ollama.
 """
 
+import asyncio
 import sys
 import io
 from pathlib import Path
@@ -15,9 +16,14 @@ import yaml
 if sys.platform == 'win32':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
 
-# Add paths
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "08-local-agent-runtime" / "runtime"))
+# Add paths (the repo root stays first so its shared packages win; the 08
+# runtime only provides agent_runtime, so it is appended)
+_REPO_ROOT = str(Path(__file__).parent.parent.parent)
+_RUNTIME_PATH = str(Path(__file__).parent.parent.parent / "08-local-agent-runtime" / "runtime")
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+if _RUNTIME_PATH not in sys.path:
+    sys.path.append(_RUNTIME_PATH)
 
 from universal_agent_nexus.runtime import get_registry
 from agent_runtime import MCPToolLoader, create_agent_graph, create_llm_with_tools
@@ -25,7 +31,6 @@ from langchain_core.messages import HumanMessage
 
 # Try to import observability helper
 try:
-    sys.path.insert(0, str(Path(__file__).parent.parent.parent))
     from universal_agent_tools.observability import setup_observability
     OBSERVABILITY_AVAILABLE = True
 except ImportError:
@@ -39,7 +44,7 @@ def load_regenerated_manifest():
         return yaml.safe_load(f)
 
 
-def create_runtime_from_manifest(manifest):
+async def create_runtime_from_manifest(manifest):
     """
     Create LangGraph runtime from regenerated manifest.
     
@@ -51,33 +56,31 @@ def create_runtime_from_manifest(manifest):
     # Extract tool configurations from manifest
     tool_configs = manifest.get('tools', [])
     
-    # Load tools from MCP servers (deduplicate by server)
+    # Get LLM model from manifest
+    router_config = manifest.get('routers', [{}])[0]
+    model = router_config.get('model', 'qwen3')
+    
+    # Only load from each server once, in manifest order
+    server_urls = list(dict.fromkeys(tc['config']['server_url'] for tc in tool_configs))
+    
+    # Servers are independent, so introspect them concurrently; the loader's
+    # own ETag/disk cache (MCP_SCHEMA_TTL) makes warm starts skip the requests
+    results = await asyncio.gather(
+        *(MCPToolLoader.load_from_server_async(url) for url in server_urls)
+    )
+    
+    # Deduplicate tools by name
     all_tools = []
-    seen_servers = set()
     seen_tools = set()
-    
-    for tool_config in tool_configs:
-        server_url = tool_config['config']['server_url']
-        tool_name = tool_config['name']
-        
-        # Only load from each server once
-        if server_url not in seen_servers:
-            tools = MCPToolLoader.load_from_server(server_url)
-            seen_servers.add(server_url)
-            
-            # Deduplicate tools by name
-            for tool in tools:
-                if tool.name not in seen_tools:
-                    all_tools.append(tool)
-                    seen_tools.add(tool.name)
+    for tools in results:
+        for tool in tools:
+            if tool.name not in seen_tools:
+                all_tools.append(tool)
+                seen_tools.add(tool.name)
     
     print(f"   [OK] Loaded {len(all_tools)} unique tools from manifest")
     print(f"   [TOOLS] Available tools: {', '.join([t.name for t in all_tools[:10]])}...")
     
-    # Get LLM model from manifest
-    router_config = manifest.get('routers', [{}])[0]
-    model = router_config.get('model', 'qwen3')
-    
     # Create LLM with tools - this enables autonomous tool calling
     print(f"   [OK] Initializing Ollama LLM: {model}")
     llm, _ = create_llm_with_tools(all_tools, model=model)
@@ -89,7 +92,67 @@ def create_runtime_from_manifest(manifest):
     return agent, all_tools
 
 
-def main():
+async def _run_task(agent, task_prompt: str, max_steps: int):
+    """Stream the agent on task_prompt, printing progress. Returns (messages, steps)."""
+    messages = []
+    step_count = 0
+    
+    stream = agent.astream(
+        {"messages": [HumanMessage(content=task_prompt)]},
+        {"recursion_limit": 100},
+        stream_mode="values"
+    )
+    try:
+        async for event in stream:
+            step_count += 1
+            messages = event.get("messages", [])
+            if not messages:
+                continue
+            
+            # Print latest message
+            last = messages[-1]
+            tool_calls = getattr(last, 'tool_calls', None) or ()
+            content = str(getattr(last, 'content', ''))
+            print(f"\n[STEP] Step {step_count} ({type(last).__name__}):")
+            for tc in tool_calls:
+                print(f"   [TOOL] Tool call: {tc.get('name')} - {tc.get('args', {})}")
+            if not tool_calls and content:
+                print(f"   [MSG] {content[:300]}")
+            
+            # Stop after max steps for testing
+            if step_count >= max_steps:
+                print(f"\n[STOP] Stopping after {max_steps} steps...")
+                break
+            
+            # Also stop if we got a successful chunk result
+            if 'chunks_created' in content:
+                print(f"\n[OK] Chunking complete! Stopping.")
+                break
+    finally:
+        # Stop the graph here rather than letting it run on after a break
+        await stream.aclose()
+    
+    return messages, step_count
+
+
+def _dump_message(index: int, msg) -> None:
+    """Print the tool-call diagnostics for one message of the final state."""
+    tool_calls = getattr(msg, 'tool_calls', None)
+    invalid_tool_calls = getattr(msg, 'invalid_tool_calls', None)
+    
+    print(f"\n   Message {index} ({type(msg).__name__}):")
+    if tool_calls:
+        print(f"      [OK] {len(tool_calls)} tool calls found!")
+        for tc in tool_calls:
+            print(f"         - {tc.get('name', 'unknown')}: {tc.get('args', {})}")
+    elif tool_calls is not None:
+        print(f"      [EMPTY] tool_calls is empty")
+    if invalid_tool_calls:
+        print(f"      invalid_tool_calls: {invalid_tool_calls}")
+    print(f"      Content: {str(getattr(msg, 'content', ''))[:200]}...")
+
+
+async def main():
     """Main runtime execution."""
     # Setup observability
     if OBSERVABILITY_AVAILABLE:
@@ -106,7 +169,7 @@ def main():
     
     # 2. Create runtime
     print("\n2. Creating runtime from manifest...")
-    agent, tools = create_runtime_from_manifest(manifest)
+    agent, tools = await create_runtime_from_manifest(manifest)
     print("   [OK] Runtime ready")
     
     # 3. Execute with repository discovery task
@@ -138,75 +201,25 @@ Start now with Step 1."""
     print(f"\n[SEND] Sending task to agent...")
     
     # Stream to see progress in real-time
-    messages = []
-    step_count = 0
     max_steps = 20  # Limit steps for full task
-    
-    for event in agent.stream(
-        {"messages": [HumanMessage(content=task_prompt)]},
-        {"recursion_limit": 100},
-        stream_mode="values"
-    ):
-        step_count += 1
-        messages = event.get("messages", [])
-        
-        # Print latest message
-        if messages:
-            last = messages[-1]
-            msg_type = type(last).__name__
-            print(f"\n[STEP] Step {step_count} ({msg_type}):")
-            
-            if hasattr(last, 'tool_calls') and last.tool_calls:
-                for tc in last.tool_calls:
-                    print(f"   [TOOL] Tool call: {tc.get('name')} - {tc.get('args', {})}")
-            elif hasattr(last, 'content') and last.content:
-                content = str(last.content)[:300]
-                print(f"   [MSG] {content}")
-        
-        # Stop after max steps for testing
-        if step_count >= max_steps:
-            print(f"\n[STOP] Stopping after {max_steps} steps...")
-            break
-        
-        # Also stop if we got a successful chunk result
-        if hasattr(last, 'content') and 'chunks_created' in str(last.content):
-            print(f"\n[OK] Chunking complete! Stopping.")
-            break
+    messages, step_count = await _run_task(agent, task_prompt, max_steps)
     
     result = {"messages": messages}
     
     # Debug: Check final state
     print(f"\n[DEBUG] Final state after {step_count} steps...")
     for i, msg in enumerate(result['messages'], 1):
-        msg_type = type(msg).__name__
-        print(f"\n   Message {i} ({msg_type}):")
-        print(f"      Has tool_calls attr: {hasattr(msg, 'tool_calls')}")
-        if hasattr(msg, 'tool_calls'):
-            print(f"      tool_calls value: {msg.tool_calls}")
-            print(f"      tool_calls type: {type(msg.tool_calls)}")
-            print(f"      tool_calls is None: {msg.tool_calls is None}")
-            if msg.tool_calls:
-                print(f"      [OK] {len(msg.tool_calls)} tool calls found!")
-                for tc in msg.tool_calls:
-                    print(f"         - {tc.get('name', 'unknown')}: {tc.get('args', {})}")
-            else:
-                print(f"      [EMPTY] tool_calls is empty/None")
-        if hasattr(msg, 'invalid_tool_calls'):
-            print(f"      invalid_tool_calls: {msg.invalid_tool_calls}")
-        if hasattr(msg, 'content'):
-            content_preview = str(msg.content)[:200]
-            print(f"      Content: {content_preview}...")
+        _dump_message(i, msg)
     
     # 4. Display results
     print("\n4. Results:")
     print("=" * 60)
     for i, message in enumerate(result['messages'], 1):
-        msg_type = type(message).__name__
-        content = message.content[:200] if len(message.content) > 200 else message.content
-        print(f"\nMessage {i} ({msg_type}):")
-        print(f"  {content}")
-        if hasattr(message, 'tool_calls') and message.tool_calls:
-            print(f"  Tool calls: {len(message.tool_calls)}")
+        tool_calls = getattr(message, 'tool_calls', None)
+        print(f"\nMessage {i} ({type(message).__name__}):")
+        print(f"  {str(message.content)[:200]}")
+        if tool_calls:
+            print(f"  Tool calls: {len(tool_calls)}")
     
     print("\n[OK] Execution complete!")
     return agent
@@ -214,7 +227,7 @@ Start now with Step 1."""
 
 if __name__ == "__main__":
     try:
-        agent = main()
+        agent = asyncio.run(main())
     except Exception as e:
         print(f"\n[ERROR] Error: {e}")
         import traceback
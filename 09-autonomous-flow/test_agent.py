@@ -0,0 +1,213 @@
+"""
+Unit tests for the AutonomousFlow agent helpers
+
+No MCP server or LLM is needed: tools are stand-ins with the same
+_run interface as MCPTool.
+"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+import agent
+from agent import _ToolResultCache, parse_tool_calls_from_content
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+
+class _FakeTool:
+    def __init__(self, name, run):
+        self.name = name
+        self._run = run
+
+
+# ===== tool-call parsing =====
+
+def test_parses_a_bare_tool_call():
+    parsed = parse_tool_calls_from_content(
+        '{"name": "get_sync_status", "arguments": {"repo": "a/b"}}', []
+    )
+    assert len(parsed) == 1
+    assert parsed[0]["name"] == "get_sync_status"
+    assert parsed[0]["args"] == {"repo": "a/b"}
+
+
+def test_parses_a_tool_call_embedded_in_text():
+    content = 'Let me check.\n{"name": "write_section", "arguments": {"meta": {"id": 1}}} done'
+    parsed = parse_tool_calls_from_content(content, [])
+    assert [tc["name"] for tc in parsed] == ["write_section"]
+    assert parsed[0]["args"] == {"meta": {"id": 1}}
+
+
+def test_finds_the_call_inside_an_outer_object():
+    content = '{"thought": "sync", "call": {"name": "bulk_sync_all", "arguments": {}}}'
+    parsed = parse_tool_calls_from_content(content, [])
+    assert [tc["name"] for tc in parsed] == ["bulk_sync_all"]
+
+
+def test_ignores_prose_and_objects_without_a_name():
+    assert parse_tool_calls_from_content("All repositories are in sync.", []) == []
+    assert parse_tool_calls_from_content('{"status": "ok"}', []) == []
+    assert parse_tool_calls_from_content("{not json", []) == []
+    assert parse_tool_calls_from_content("", []) == []
+
+
+def test_repeated_calls_get_distinct_ids():
+    content = '{"name": "get_storage_stats", "arguments": {}}'
+    first = parse_tool_calls_from_content(content, [])[0]["id"]
+    second = parse_tool_calls_from_content(content, [])[0]["id"]
+    assert first.startswith("call_get_storage_stats_")
+    assert first != second
+
+
+# ===== tool result cache =====
+
+def test_tool_cache_drops_results_read_before_a_clear():
+    cache = _ToolResultCache(maxsize=8, ttl=60)
+    key = cache.key("get_sync_status", {"repo": "a/b"})
+    generation = cache.generation
+    cache.clear()
+    cache.put(key, "stale", generation)
+    assert cache.get(key) is None
+
+    cache.put(key, "fresh", cache.generation)
+    assert cache.get(key) == "fresh"
+
+
+def test_tool_cache_key_ignores_argument_order():
+    assert _ToolResultCache.key("t", {"a": 1, "b": 2}) == _ToolResultCache.key("t", {"b": 2, "a": 1})
+    assert _ToolResultCache.key("t", {"a": 1}) != _ToolResultCache.key("u", {"a": 1})
+
+
+def test_write_during_a_read_keeps_the_read_out_of_the_cache(monkeypatch):
+    monkeypatch.setattr(agent, "_TOOL_CACHE", _ToolResultCache(8, 60))
+    read_started = threading.Event()
+    write_done = threading.Event()
+    calls = []
+
+    def slow_read(**kwargs):
+        calls.append("read")
+        read_started.set()
+        write_done.wait(5)
+        return "before write"
+
+    def write(**kwargs):
+        calls.append("write")
+        return "written"
+
+    tools = {
+        "get_sync_status": _FakeTool("get_sync_status", slow_read),
+        "bulk_sync_all": _FakeTool("bulk_sync_all", write),
+    }
+    read_call = {"name": "get_sync_status", "args": {}, "id": "r1"}
+
+    reader = threading.Thread(target=agent._execute_tool_call, args=(read_call, tools, []))
+    reader.start()
+    read_started.wait(5)
+    agent._execute_tool_call({"name": "bulk_sync_all", "args": {}, "id": "w1"}, tools, [])
+    write_done.set()
+    reader.join(5)
+
+    events = []
+    agent._execute_tool_call(read_call, tools, events)
+    assert events[0]["status"] == "ok"
+    assert calls == ["read", "write", "read"]
+
+
+# ===== tool turns =====
+
+def test_writes_in_one_turn_run_in_the_requested_order(monkeypatch):
+    monkeypatch.setattr(agent, "_TOOL_CACHE", _ToolResultCache(8, 60))
+    log = []
+
+    def recorder(name, delay=0.0):
+        def run(**kwargs):
+            # A concurrent later call would overtake a slow earlier one
+            time.sleep(delay)
+            log.append(name)
+            return name
+        return _FakeTool(name, run)
+
+    tools = {
+        "create_document_plan": recorder("create_document_plan", delay=0.05),
+        "write_section": recorder("write_section", delay=0.02),
+        "compile_document": recorder("compile_document"),
+    }
+    calls = [
+        {"name": name, "args": {}, "id": f"call_{i}"}
+        for i, name in enumerate(["create_document_plan", "write_section", "compile_document"])
+    ]
+
+    messages = agent._run_tool_calls(calls, tools)
+
+    assert log == ["create_document_plan", "write_section", "compile_document"]
+    assert [m.tool_call_id for m in messages] == ["call_0", "call_1", "call_2"]
+
+
+def test_reads_in_one_turn_run_concurrently(monkeypatch):
+    monkeypatch.setattr(agent, "_TOOL_CACHE", _ToolResultCache(8, 60))
+    both_reads = threading.Barrier(2, timeout=2)
+
+    def read(name):
+        def run(**kwargs):
+            # Completes only if the other read is running at the same time
+            both_reads.wait()
+            return name
+        return _FakeTool(name, run)
+
+    tools = {"get_sync_status": read("get_sync_status"), "list_sections": read("list_sections")}
+    calls = [
+        {"name": "get_sync_status", "args": {}, "id": "call_0"},
+        {"name": "list_sections", "args": {}, "id": "call_1"},
+    ]
+
+    messages = agent._run_tool_calls(calls, tools)
+
+    assert [m.content for m in messages] == ["get_sync_status", "list_sections"]
+
+
+# ===== history window =====
+
+def _tool_exchange(name, i):
+    return [
+        AIMessage(content="", tool_calls=[{"name": name, "args": {}, "id": f"call_{i}"}]),
+        ToolMessage(content=f"{name} result", tool_call_id=f"call_{i}"),
+    ]
+
+
+def test_window_keeps_the_prompt_and_first_tool_result(monkeypatch):
+    monkeypatch.setattr(agent, "_HISTORY_WINDOW", 4)
+    messages = [HumanMessage(content="task"), *_tool_exchange("analyze_full_stack", 0)]
+    for i in range(1, 8):
+        messages += _tool_exchange("write_section", i)
+
+    window = agent._window_messages(messages)
+
+    assert window[:3] == messages[:3]
+    assert window[3:] == messages[-4:]
+    assert not isinstance(window[3], ToolMessage)
+
+
+def test_window_never_starts_with_an_orphaned_tool_result(monkeypatch):
+    monkeypatch.setattr(agent, "_HISTORY_WINDOW", 3)
+    messages = [HumanMessage(content="task"), *_tool_exchange("analyze_full_stack", 0)]
+    for i in range(1, 5):
+        messages += _tool_exchange("write_section", i)
+
+    window = agent._window_messages(messages)
+
+    assert window[:3] == messages[:3]
+    assert window[3:] == messages[-2:]
+
+
+def test_short_histories_and_a_disabled_window_send_everything(monkeypatch):
+    messages = [HumanMessage(content="task"), *_tool_exchange("analyze_full_stack", 0)]
+    monkeypatch.setattr(agent, "_HISTORY_WINDOW", 2)
+    assert agent._window_messages(messages) == messages
+
+    messages += _tool_exchange("write_section", 1) * 5
+    monkeypatch.setattr(agent, "_HISTORY_WINDOW", 0)
+    assert agent._window_messages(messages) == messages
+
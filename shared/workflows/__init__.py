@@ -70,6 +70,8 @@ from shared.workflows.workflow import (
     WorkflowExecutionError,
 )
 
+from shared.workflows.batching import MicroBatcher
+
 from shared.workflows.helpers import (
     ToolCallingWorkflow,
     ConditionalWorkflow,
@@ -95,6 +97,8 @@ __all__ = [
     "SimpleQAWorkflow",
     "ToolCall",
     "ConditionalBranchExecution",
+    # Batching
+    "MicroBatcher",
 ]
 
 __version__ = "0.2.0"
@@ -0,0 +1,109 @@
+"""
+Micro-batching for concurrent async callers.
+
+Requests that arrive within a short window are handed to one batch call
+instead of each caller driving its own. Subclasses provide the batch call
+(``_run_batch``) and a public entry point named for their domain.
+
+Example:
+    class EchoBatcher(MicroBatcher):
+        async def _run_batch(self, items):
+            return items
+
+    batcher = EchoBatcher(max_batch_size=8)
+    results = await asyncio.gather(*(batcher.submit(i) for i in range(20)))
+    await batcher.aclose()
+"""
+
+import asyncio
+from typing import Any, List, Optional
+
+
+class MicroBatcher:
+    """
+    Coalesce concurrent submit() calls into _run_batch() calls.
+
+    The window adapts to load: an idle queue waits up to max_wait_ms for
+    company, a filling batch waits proportionally less, and a full batch is
+    dispatched immediately. Batches run concurrently with collection of the
+    next one.
+    """
+
+    def __init__(self, max_batch_size: int = 8, max_wait_ms: float = 20.0):
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+
+    async def _run_batch(self, items: List[Any]) -> List[Any]:
+        """Return one result (or exception instance) per item, in order."""
+        raise NotImplementedError
+
+    async def submit(self, item: Any) -> Any:
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._collect())
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    async def aclose(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _collect(self) -> None:
+        batch: list = []
+        try:
+            await self._collect_batches(batch)
+        except asyncio.CancelledError:
+            # Callers already taken off the queue, or still queued, would
+            # otherwise wait forever on futures nobody resolves
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError("batcher closed before the request ran"))
+            raise
+
+    async def _collect_batches(self, batch: list) -> None:
+        """Fill batch in place (so _collect can fail it on cancel) and dispatch it."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch.clear()
+            batch.append(await self._queue.get())
+            deadline = loop.time() + self.max_wait_ms / 1000
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                # The fuller the batch, the less it is worth waiting for more
+                wait = (deadline - loop.time()) * (1 - len(batch) / self.max_batch_size)
+                if wait <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), wait))
+                except asyncio.TimeoutError:
+                    break
+
+            # Keep collecting the next batch while this one runs
+            task = asyncio.create_task(self._dispatch(list(batch)))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: list) -> None:
+        try:
+            results = await self._run_batch([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
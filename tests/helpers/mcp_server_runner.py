@@ -54,6 +54,9 @@ def find_free_port(start_port: int, max_attempts: int = 10) -> int:
 def is_port_in_use(port: int) -> bool:
     """Check if a port is in use."""
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        # Connections from the previous test linger in TIME_WAIT; those don't
+        # stop a server from binding, so they must not count as "in use"
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         try:
             s.bind(('localhost', port))
             return False
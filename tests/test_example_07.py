@@ -0,0 +1,72 @@
+"""Unit tests for Example 07: Innovation Waves structured output validation
+
+Tests the validation agent's repair path (no LLM calls are made).
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from pydantic import BaseModel, Field
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "07-innovation-waves" / "backend"))
+
+from structured_output_pattern import StructuredOutputExtractor
+
+
+# ============================================================================
+# Schemas
+# ============================================================================
+
+class Position(BaseModel):
+    x: int
+
+
+class Signal(BaseModel):
+    score: float = Field(..., ge=0, le=1)
+    count: int
+    position: Position
+
+
+class Event(BaseModel):
+    name: str
+    count: int
+    tags: list = Field(default_factory=list)
+
+
+# ============================================================================
+# Tests
+# ============================================================================
+
+def test_repaired_record_is_fully_validated():
+    """Fields repaired alongside others still go through type coercion."""
+    extractor = StructuredOutputExtractor(schema=Signal)
+    result = extractor._fast_fix_and_validate(
+        {"score": 1.5, "count": "3", "position": {"x": "2"}},
+        [{"loc": ("score",), "type": "less_than_equal"}],
+        {},
+    )
+    assert result.score == 1.0
+    assert result.count == 3
+    assert result.position == Position(x=2)
+
+
+def test_missing_nested_field_is_not_papered_over():
+    """A missing field inside a nested model raises instead of replacing the parent."""
+    extractor = StructuredOutputExtractor(schema=Signal)
+    with pytest.raises(ValueError):
+        extractor.validation_agent({"score": "0.5", "count": "3", "position": {}}, {})
+
+
+def test_missing_field_filled_from_context_is_coerced():
+    extractor = StructuredOutputExtractor(schema=Event)
+    result = extractor.validation_agent({"count": "4"}, {"name": "launch"})
+    assert result == Event(name="launch", count=4, tags=[])
+
+
+def test_missing_field_without_default_or_context_raises():
+    extractor = StructuredOutputExtractor(schema=Event)
+    with pytest.raises(ValueError):
+        extractor._fast_fix_and_validate(
+            {"count": 4}, [{"loc": ("name",), "type": "missing"}], {}
+        )
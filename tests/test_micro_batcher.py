@@ -0,0 +1,107 @@
+"""
+Tests for MicroBatcher (shared micro-batching base)
+
+Tests focus on:
+- Results returned to the right caller, in order
+- Batch size limits
+- Failures reported per item or per batch
+- Pending callers failed, not stranded, on close
+
+Run with: pytest tests/test_micro_batcher.py -v
+"""
+
+import asyncio
+
+from shared.workflows import MicroBatcher
+
+
+class RecordingBatcher(MicroBatcher):
+    """Doubles each item and records the batches it was handed."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    async def _run_batch(self, items):
+        self.batches.append(list(items))
+        return [
+            ValueError(f"bad item {item}") if item < 0 else item * 2
+            for item in items
+        ]
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_each_caller_gets_its_own_result():
+    async def scenario():
+        batcher = RecordingBatcher(max_batch_size=4, max_wait_ms=20)
+        results = await asyncio.gather(*(batcher.submit(i) for i in range(10)))
+        await batcher.aclose()
+        return batcher, results
+
+    batcher, results = run(scenario())
+    assert results == [i * 2 for i in range(10)]
+    assert all(len(batch) <= 4 for batch in batcher.batches)
+    assert [item for batch in batcher.batches for item in batch] == list(range(10))
+    assert len(batcher.batches) < 10
+
+
+def test_item_exceptions_only_fail_their_caller():
+    async def scenario():
+        batcher = RecordingBatcher(max_batch_size=8)
+        results = await asyncio.gather(
+            batcher.submit(1), batcher.submit(-1), batcher.submit(2),
+            return_exceptions=True,
+        )
+        await batcher.aclose()
+        return results
+
+    ok1, failed, ok2 = run(scenario())
+    assert (ok1, ok2) == (2, 4)
+    assert isinstance(failed, ValueError)
+
+
+def test_batch_failure_fails_every_caller_in_the_batch():
+    class FailingBatcher(MicroBatcher):
+        async def _run_batch(self, items):
+            raise RuntimeError("backend down")
+
+    async def scenario():
+        batcher = FailingBatcher(max_batch_size=8)
+        results = await asyncio.gather(
+            *(batcher.submit(i) for i in range(3)), return_exceptions=True
+        )
+        await batcher.aclose()
+        return results
+
+    results = run(scenario())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_close_fails_callers_still_waiting_for_a_batch():
+    async def scenario():
+        batcher = RecordingBatcher(max_batch_size=8, max_wait_ms=10_000)
+        pending = [asyncio.ensure_future(batcher.submit(i)) for i in range(3)]
+        await asyncio.sleep(0.05)
+        await batcher.aclose()
+        return await asyncio.wait_for(
+            asyncio.gather(*pending, return_exceptions=True), timeout=1
+        )
+
+    results = run(scenario())
+    assert len(results) == 3
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_batcher_restarts_after_close():
+    async def scenario():
+        batcher = RecordingBatcher(max_batch_size=2)
+        first = await batcher.submit(1)
+        await batcher.aclose()
+        second = await batcher.submit(2)
+        await batcher.aclose()
+        return first, second
+
+    assert run(scenario()) == (2, 4)